@@ -3,38 +3,75 @@
 CLI script to run the YouTube MCP Server.
 """
 
-import argparse
 import asyncio
 import logging
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add the src directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from youtube_mcp_server import __main__
-
 
 def setup_logging(level: str = "INFO"):
-    """Setup logging configuration."""
+    """Setup logging configuration.
+    
+    Logs go to stderr: stdout carries the MCP stdio JSON-RPC stream.
+    """
     logging.basicConfig(
         level=getattr(logging, level.upper()),
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
-            logging.StreamHandler(sys.stdout)
+            logging.StreamHandler(sys.stderr)
         ]
     )
 
 
-def parse_args():
-    """Parse command line arguments."""
+def run_async(coro):
+    """Run a coroutine, using the eager task factory where supported (3.12+)."""
+    task_factory = getattr(asyncio, "eager_task_factory", None)
+    if task_factory is None:
+        return asyncio.run(coro)
+    
+    def loop_factory():
+        loop = asyncio.new_event_loop()
+        loop.set_task_factory(task_factory)
+        return loop
+    
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+VERSION = "YouTube MCP Server 1.0.0"
+
+
+def _log_level(value: str) -> str:
+    if value not in LOG_LEVELS:
+        raise ValueError(value)
+    return value
+
+
+# Flags handled by the fast path in parse_args: flag -> (dest, converter)
+_FAST_FLAGS = {
+    "--log-level": ("log_level", _log_level),
+    "--config-file": ("config_file", Path),
+    "--host": ("host", str),
+    "--port": ("port", int),
+}
+
+
+def build_parser():
+    """Build the full argparse parser (used for --help and invalid input)."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="YouTube MCP Server - Model Context Protocol server for YouTube analytics"
     )
     
     parser.add_argument(
         "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=LOG_LEVELS,
         default="INFO",
         help="Set the logging level (default: INFO)"
     )
@@ -61,10 +98,48 @@ def parse_args():
     parser.add_argument(
         "--version",
         action="version",
-        version="YouTube MCP Server 1.0.0"
+        version=VERSION
     )
     
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv=None):
+    """Parse command line arguments.
+    
+    The known flags are scanned directly so a normal launch doesn't import
+    argparse. Anything else (--help, unknown flags, invalid values) is handed
+    to the argparse parser so usage and error messages are unchanged.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    args = {"log_level": "INFO", "config_file": None, "host": "localhost", "port": 8000}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--version":
+            print(VERSION)
+            sys.exit(0)
+        
+        flag, has_value, value = arg.partition("=")
+        spec = _FAST_FLAGS.get(flag)
+        if spec is None:
+            return build_parser().parse_args(argv)
+        if not has_value:
+            i += 1
+            if i == len(argv) or argv[i].startswith("--"):
+                return build_parser().parse_args(argv)
+            value = argv[i]
+        
+        dest, convert = spec
+        try:
+            args[dest] = convert(value)
+        except ValueError:
+            return build_parser().parse_args(argv)
+        i += 1
+    
+    return SimpleNamespace(**args)
 
 
 def main():
@@ -77,11 +152,19 @@ def main():
     logger = logging.getLogger(__name__)
     logger.info("Starting YouTube MCP Server CLI...")
     
+    # Use uvloop when available (not supported on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     try:
         # Set environment variables from args if needed
         import os
-        if args.config_file and args.config_file.exists():
-            logger.info(f"Loading config from: {args.config_file}")
+        # load_dotenv tolerates a missing file, so skip the extra stat
+        if args.config_file:
+            logger.info("Loading config from: %s", args.config_file)
             from dotenv import load_dotenv
             load_dotenv(args.config_file)
         
@@ -91,8 +174,12 @@ def main():
         if args.port != 8000:
             os.environ["SERVER_PORT"] = str(args.port)
         
+        # Import the server only once we know it will run, so --help and
+        # --version don't pay for the full dependency tree
+        from youtube_mcp_server import __main__
+        
         # Run the server
-        asyncio.run(__main__.main())
+        run_async(__main__.main())
         
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
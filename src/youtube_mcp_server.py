@@ -1,146 +1,119 @@
+    # Focus-area instructions for the transcript analysis prompt
+    _FOCUS_PROMPTS = {
+        "content_quality": "Focus on analyzing the quality of content, including factual accuracy, depth of information, and clarity of explanation.",
+        "audience_engagement": "Focus on elements that engage or disengage the audience, including storytelling techniques, hooks, and calls to action.",
+        "seo_optimization": "Focus on keyword usage, title optimization, description quality, and other SEO factors.",
+        "educational_value": "Focus on the educational aspects, including teaching methods, knowledge transfer, and learning outcomes."
+    }
+    
+    # Factor-specific instructions for the video comparison prompt
+    _FACTOR_INSTRUCTIONS = {
+        "engagement": "Compare engagement metrics (views, likes, comments) and audience reception.",
+        "content": "Compare content quality, topic coverage, information depth, and overall value.",
+        "production_quality": "Compare production elements like audio quality, visual presentation, editing style, and overall professionalism.",
+        "seo": "Compare SEO effectiveness including titles, descriptions, tags, and keyword optimization."
+    }
+    
+    # Template for the content guidance prompt
+    _CONTENT_GUIDANCE_TEMPLATE = (
+        "I'm planning to create a YouTube video about '{topic}' for an audience described as '{audience}'. The video will be approximately {length_minutes} minutes long.\n\n"
+        "Please provide comprehensive guidance for creating this YouTube video, including:\n\n"
+        "1. Title suggestions that would perform well in search and attract clicks\n"
+        "2. A recommended video structure with timeframes for each section\n"
+        "3. Key points to cover based on the topic and audience\n"
+        "4. Thumbnail design recommendations\n"
+        "5. Description template with SEO considerations\n"
+        "6. Tag suggestions\n"
+        "7. Hooks and engagement strategies for the first 30 seconds\n"
+        "8. Ideas for calls-to-action\n"
+        "9. Potential B-roll/visual suggestions\n"
+        "10. Common pitfalls to avoid for this type of content\n\n"
+        "Please be specific and provide actionable guidance that will help me create a high-quality, engaging YouTube video for my target audience."
+    )
+    
+    # Seconds to collect concurrent video load requests into one batch
+    _VIDEO_LOAD_WINDOW = 0.05
+    
+    # Futures by video id for every queued or in-progress load (None until
+    # the first load), plus the ids waiting for the next batch and the task
+    # that will load them (both None while no batch is queued)
+    _video_load_futures = None
+    _queued_video_ids = None
+    _video_load_task = None
+    
     async def _transcript_analysis_prompt(self, params):
         """Generate a detailed transcript analysis prompt."""
         try:
             video_id = params["video_id"]
             focus_area = params["focus_area"]
             
-            logger.info(f"Creating transcript analysis prompt for video: {video_id}, focus: {focus_area}")
+            logger.info("Creating transcript analysis prompt for video: %s, focus: %s", video_id, focus_area)
             
             # Get the transcript
-            transcripts = self.youtube_collector.get_transcripts([video_id])
+            transcripts = await asyncio.to_thread(self.youtube_collector.get_transcripts, [video_id])
             
-            if video_id not in transcripts or not transcripts[video_id]:
-                return {
-                    "messages": [{
-                        "role": "user",
-                        "content": {
-                            "type": "text",
-                            "text": f"I wanted to analyze the transcript of YouTube video {video_id}, but no transcript was found for this video."
-                        }
-                    }]
-                }
+            segments = transcripts.get(video_id)
+            if not segments:
+                return self._msg(f"I wanted to analyze the transcript of YouTube video {video_id}, but no transcript was found for this video.")
             
             # Format the transcript
-            transcript_text = ""
-            for segment in transcripts[video_id]:
-                start_time = self._format_time(segment.get("start", 0))
-                text = segment.get("text", "")
-                transcript_text += f"[{start_time}] {text}\n"
+            transcript_text = self._render_transcript(segments)
             
             # Get video details if available
-            video_title = ""
-            if video_id in self.youtube_collector.video_data:
-                video_data = self.youtube_collector.video_data[video_id]
-                if isinstance(video_data, list):
-                    video_data = video_data[-1]
-                video_title = video_data.get("title", "")
+            video_data = self._get_latest_video(video_id)
+            video_title = video_data.get("title", "") if video_data else ""
             
             # Create focus-specific prompt
-            focus_prompts = {
-                "content_quality": "Focus on analyzing the quality of content, including factual accuracy, depth of information, and clarity of explanation.",
-                "audience_engagement": "Focus on elements that engage or disengage the audience, including storytelling techniques, hooks, and calls to action.",
-                "seo_optimization": "Focus on keyword usage, title optimization, description quality, and other SEO factors.",
-                "educational_value": "Focus on the educational aspects, including teaching methods, knowledge transfer, and learning outcomes."
-            }
-            
-            focus_instruction = focus_prompts.get(focus_area, "Provide a general analysis of the transcript.")
-            
-            return {
-                "messages": [{
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"Please analyze this YouTube video transcript with a focus on {focus_area.replace('_', ' ')}.\n\n"
-                               f"Video: {video_title} (ID: {video_id})\n\n"
-                               f"INSTRUCTIONS: {focus_instruction}\n\n"
-                               f"TRANSCRIPT:\n{transcript_text}\n\n"
-                               f"Provide a detailed, structured analysis addressing the focus area of {focus_area.replace('_', ' ')}."
-                    }
-                }]
-            }
+            focus_instruction = self._FOCUS_PROMPTS.get(focus_area, "Provide a general analysis of the transcript.")
+            
+            return self._msg(
+                f"Please analyze this YouTube video transcript with a focus on {focus_area.replace('_', ' ')}.\n\n"
+                f"Video: {video_title} (ID: {video_id})\n\n"
+                f"INSTRUCTIONS: {focus_instruction}\n\n"
+                f"TRANSCRIPT:\n{transcript_text}\n\n"
+                f"Provide a detailed, structured analysis addressing the focus area of {focus_area.replace('_', ' ')}."
+            )
         except Exception as e:
-            logger.error(f"Error creating transcript analysis prompt: {e}")
-            return {
-                "messages": [{
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"I was going to analyze the transcript of YouTube video {video_id}, but encountered an error: {str(e)}"
-                    }
-                }]
-            }
+            logger.error("Error creating transcript analysis prompt: %s", e)
+            return self._msg(f"I was going to analyze the transcript of YouTube video {video_id}, but encountered an error: {str(e)}")
     
     async def _thumbnail_analysis_prompt(self, params):
         """Generate a detailed thumbnail analysis prompt."""
         try:
             video_id = params["video_id"]
             
-            logger.info(f"Creating thumbnail analysis prompt for video: {video_id}")
+            logger.info("Creating thumbnail analysis prompt for video: %s", video_id)
             
             # First, ensure we have the video data
-            if video_id not in self.youtube_collector.video_data:
-                self.youtube_collector.load_data_from_ids([video_id])
+            await self._load_videos([video_id])
             
-            if video_id not in self.youtube_collector.video_data:
-                return {
-                    "messages": [{
-                        "role": "user",
-                        "content": {
-                            "type": "text",
-                            "text": f"I wanted to analyze the thumbnail of YouTube video {video_id}, but couldn't find data for this video."
-                        }
-                    }]
-                }
+            video_data = self._get_latest_video(video_id)
+            if video_data is None:
+                return self._msg(f"I wanted to analyze the thumbnail of YouTube video {video_id}, but couldn't find data for this video.")
             
             # Get the thumbnail URL
-            video_data = self.youtube_collector.video_data[video_id]
-            if isinstance(video_data, list):
-                video_data = video_data[-1]  # Get the most recent data
-            
             video_title = video_data.get("title", "")
             thumbnail_url = video_data.get("thumbnail_url", "")
             
             if not thumbnail_url:
-                return {
-                    "messages": [{
-                        "role": "user",
-                        "content": {
-                            "type": "text",
-                            "text": f"I wanted to analyze the thumbnail of YouTube video {video_id} ({video_title}), but couldn't find a thumbnail URL."
-                        }
-                    }]
-                }
-            
-            return {
-                "messages": [{
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"Please analyze this YouTube video thumbnail in detail.\n\n"
-                               f"Video: {video_title} (ID: {video_id})\n"
-                               f"Thumbnail URL: {thumbnail_url}\n\n"
-                               f"INSTRUCTIONS:\n"
-                               f"1. Describe the main visual elements in the thumbnail\n"
-                               f"2. Analyze any text present (content, color, font, positioning)\n"
-                               f"3. Evaluate the color scheme and visual hierarchy\n"
-                               f"4. Assess the thumbnail's ability to attract clicks\n"
-                               f"5. Suggest improvements or alternatives\n"
-                               f"6. Compare to best practices for YouTube thumbnails\n\n"
-                               f"Please provide a comprehensive analysis addressing all aspects of the thumbnail design and effectiveness."
-                    }
-                }]
-            }
+                return self._msg(f"I wanted to analyze the thumbnail of YouTube video {video_id} ({video_title}), but couldn't find a thumbnail URL.")
+            
+            return self._msg(
+                f"Please analyze this YouTube video thumbnail in detail.\n\n"
+                f"Video: {video_title} (ID: {video_id})\n"
+                f"Thumbnail URL: {thumbnail_url}\n\n"
+                f"INSTRUCTIONS:\n"
+                f"1. Describe the main visual elements in the thumbnail\n"
+                f"2. Analyze any text present (content, color, font, positioning)\n"
+                f"3. Evaluate the color scheme and visual hierarchy\n"
+                f"4. Assess the thumbnail's ability to attract clicks\n"
+                f"5. Suggest improvements or alternatives\n"
+                f"6. Compare to best practices for YouTube thumbnails\n\n"
+                f"Please provide a comprehensive analysis addressing all aspects of the thumbnail design and effectiveness."
+            )
         except Exception as e:
-            logger.error(f"Error creating thumbnail analysis prompt: {e}")
-            return {
-                "messages": [{
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"I was going to analyze the thumbnail of YouTube video {video_id}, but encountered an error: {str(e)}"
-                    }
-                }]
-            }
+            logger.error("Error creating thumbnail analysis prompt: %s", e)
+            return self._msg(f"I was going to analyze the thumbnail of YouTube video {video_id}, but encountered an error: {str(e)}")
     
     async def _comment_analysis_prompt(self, params):
         """Generate a prompt for analyzing video comments."""
@@ -148,70 +121,46 @@
             video_id = params["video_id"]
             max_comments = params["max_comments"]
             
-            logger.info(f"Creating comment analysis prompt for video: {video_id}")
-            
-            # Get video details
-            video_title = ""
-            if video_id in self.youtube_collector.video_data:
-                video_data = self.youtube_collector.video_data[video_id]
-                if isinstance(video_data, list):
-                    video_data = video_data[-1]
-                video_title = video_data.get("title", "")
+            logger.info("Creating comment analysis prompt for video: %s", video_id)
             
             # Get comments
-            comments = self.youtube_collector.get_comments(
+            comments = await asyncio.to_thread(
+                self.youtube_collector.get_comments,
                 video_id=video_id,
                 max_results=max_comments
             )
             
             if not comments:
-                return {
-                    "messages": [{
-                        "role": "user",
-                        "content": {
-                            "type": "text",
-                            "text": f"I wanted to analyze comments from YouTube video {video_id}, but no comments were found."
-                        }
-                    }]
-                }
+                return self._msg(f"I wanted to analyze comments from YouTube video {video_id}, but no comments were found.")
+            
+            # Get video details
+            video_data = self._get_latest_video(video_id)
+            video_title = video_data.get("title", "") if video_data else ""
             
             # Format comments
-            comments_text = ""
+            parts = []
             for i, comment in enumerate(comments, 1):
-                comments_text += f"{i}. Author: {comment.author}\n"
-                comments_text += f"   Likes: {comment.like_count}\n"
-                comments_text += f"   Text: {comment.text}\n\n"
-            
-            return {
-                "messages": [{
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"Please analyze the following comments from the YouTube video: {video_title} (ID: {video_id}).\n\n"
-                               f"COMMENTS:\n{comments_text}\n"
-                               f"INSTRUCTIONS:\n"
-                               f"1. Identify the overall sentiment (positive, negative, neutral, mixed)\n"
-                               f"2. Extract key themes and topics mentioned frequently\n"
-                               f"3. Highlight any constructive feedback or suggestions\n"
-                               f"4. Note any questions or concerns that could be addressed\n"
-                               f"5. Identify what viewers liked most about the content\n"
-                               f"6. Analyze the engagement level based on comment quality\n"
-                               f"7. Provide recommendations on how to improve future content based on this feedback\n\n"
-                               f"Please provide a comprehensive analysis that could help the content creator understand their audience better."
-                    }
-                }]
-            }
+                parts.append(f"{i}. Author: {comment.author}\n")
+                parts.append(f"   Likes: {comment.like_count}\n")
+                parts.append(f"   Text: {comment.text}\n\n")
+            comments_text = "".join(parts)
+            
+            return self._msg(
+                f"Please analyze the following comments from the YouTube video: {video_title} (ID: {video_id}).\n\n"
+                f"COMMENTS:\n{comments_text}\n"
+                f"INSTRUCTIONS:\n"
+                f"1. Identify the overall sentiment (positive, negative, neutral, mixed)\n"
+                f"2. Extract key themes and topics mentioned frequently\n"
+                f"3. Highlight any constructive feedback or suggestions\n"
+                f"4. Note any questions or concerns that could be addressed\n"
+                f"5. Identify what viewers liked most about the content\n"
+                f"6. Analyze the engagement level based on comment quality\n"
+                f"7. Provide recommendations on how to improve future content based on this feedback\n\n"
+                f"Please provide a comprehensive analysis that could help the content creator understand their audience better."
+            )
         except Exception as e:
-            logger.error(f"Error creating comment analysis prompt: {e}")
-            return {
-                "messages": [{
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"I was going to analyze comments from YouTube video {video_id}, but encountered an error: {str(e)}"
-                    }
-                }]
-            }
+            logger.error("Error creating comment analysis prompt: %s", e)
+            return self._msg(f"I was going to analyze comments from YouTube video {video_id}, but encountered an error: {str(e)}")
     
     async def _video_comparison_prompt(self, params):
         """Generate a prompt for comparing multiple videos."""
@@ -219,25 +168,18 @@
             video_ids = params["video_ids"]
             comparison_factors = params["comparison_factors"]
             
-            logger.info(f"Creating video comparison prompt for videos: {', '.join(video_ids)}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Creating video comparison prompt for videos: %s", ", ".join(video_ids))
             
             # Ensure we have data for all videos
-            missing_ids = []
-            for video_id in video_ids:
-                if video_id not in self.youtube_collector.video_data:
-                    missing_ids.append(video_id)
-            
-            if missing_ids:
-                self.youtube_collector.load_data_from_ids(missing_ids)
+            await self._load_videos(video_ids)
             
             # Collect video details
             videos_info = []
+            truncate = self._truncate_text
             for video_id in video_ids:
-                if video_id in self.youtube_collector.video_data:
-                    video_data = self.youtube_collector.video_data[video_id]
-                    if isinstance(video_data, list):
-                        video_data = video_data[-1]
-                    
+                video_data = self._get_latest_video(video_id)
+                if video_data is not None:
                     videos_info.append({
                         "id": video_id,
                         "title": video_data.get("title", ""),
@@ -245,70 +187,51 @@
                         "like_count": video_data.get("like_count", 0),
                         "comment_count": video_data.get("comment_count", 0),
                         "upload_date": video_data.get("upload_date", ""),
-                        "description": self._truncate_text(video_data.get("description", ""), 200)
+                        "description": truncate(video_data.get("description", ""))
                     })
             
             if not videos_info or len(videos_info) < 2:
-                return {
-                    "messages": [{
-                        "role": "user",
-                        "content": {
-                            "type": "text",
-                            "text": f"I wanted to compare YouTube videos {', '.join(video_ids)}, but couldn't find enough data for comparison."
-                        }
-                    }]
-                }
+                return self._msg(f"I wanted to compare YouTube videos {', '.join(video_ids)}, but couldn't find enough data for comparison.")
             
             # Generate factor-specific instructions
-            factor_instructions = {
-                "engagement": "Compare engagement metrics (views, likes, comments) and audience reception.",
-                "content": "Compare content quality, topic coverage, information depth, and overall value.",
-                "production_quality": "Compare production elements like audio quality, visual presentation, editing style, and overall professionalism.",
-                "seo": "Compare SEO effectiveness including titles, descriptions, tags, and keyword optimization."
-            }
-            
-            factors_text = "\n".join([f"- {factor.capitalize()}: {factor_instructions.get(factor, '')}" 
-                                    for factor in comparison_factors])
+            factor_instructions = self._FACTOR_INSTRUCTIONS
+            factors_text = "\n".join(
+                f"- {factor.capitalize()}: {factor_instructions.get(factor, '')}"
+                for factor in comparison_factors
+            )
             
             # Format videos information
-            videos_text = ""
+            parts = []
             for i, video in enumerate(videos_info, 1):
-                videos_text += f"VIDEO {i}: {video['title']} (ID: {video['id']})\n"
-                videos_text += f"- Views: {video['view_count']}\n"
-                videos_text += f"- Likes: {video['like_count']}\n"
-                videos_text += f"- Comments: {video['comment_count']}\n"
-                videos_text += f"- Upload Date: {video['upload_date']}\n"
-                videos_text += f"- Description: {video['description']}\n\n"
-            
-            return {
-                "messages": [{
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"Please compare the following YouTube videos, focusing on these aspects: {', '.join(comparison_factors)}.\n\n"
-                               f"VIDEOS TO COMPARE:\n\n{videos_text}\n"
-                               f"COMPARISON FACTORS:\n{factors_text}\n\n"
-                               f"INSTRUCTIONS:\n"
-                               f"1. Provide a head-to-head comparison of the videos for each factor\n"
-                               f"2. Identify strengths and weaknesses of each video\n"
-                               f"3. Determine which video performs best in each category\n"
-                               f"4. Provide an overall comparison summary\n"
-                               f"5. Suggest what each video could learn from the others\n\n"
-                               f"Please provide a comprehensive comparison that highlights meaningful differences and similarities."
-                    }
-                }]
-            }
+                title, vid, views, likes, comment_count, upload_date, description = (
+                    video["title"], video["id"], video["view_count"], video["like_count"],
+                    video["comment_count"], video["upload_date"], video["description"],
+                )
+                parts.append(
+                    f"VIDEO {i}: {title} (ID: {vid})\n"
+                    f"- Views: {views}\n"
+                    f"- Likes: {likes}\n"
+                    f"- Comments: {comment_count}\n"
+                    f"- Upload Date: {upload_date}\n"
+                    f"- Description: {description}\n\n"
+                )
+            videos_text = "".join(parts)
+            
+            return self._msg(
+                f"Please compare the following YouTube videos, focusing on these aspects: {', '.join(comparison_factors)}.\n\n"
+                f"VIDEOS TO COMPARE:\n\n{videos_text}\n"
+                f"COMPARISON FACTORS:\n{factors_text}\n\n"
+                f"INSTRUCTIONS:\n"
+                f"1. Provide a head-to-head comparison of the videos for each factor\n"
+                f"2. Identify strengths and weaknesses of each video\n"
+                f"3. Determine which video performs best in each category\n"
+                f"4. Provide an overall comparison summary\n"
+                f"5. Suggest what each video could learn from the others\n\n"
+                f"Please provide a comprehensive comparison that highlights meaningful differences and similarities."
+            )
         except Exception as e:
-            logger.error(f"Error creating video comparison prompt: {e}")
-            return {
-                "messages": [{
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"I was going to compare YouTube videos {', '.join(video_ids)}, but encountered an error: {str(e)}"
-                    }
-                }]
-            }
+            logger.error("Error creating video comparison prompt: %s", e)
+            return self._msg(f"I was going to compare YouTube videos {', '.join(video_ids)}, but encountered an error: {str(e)}")
     
     async def _content_guidance_prompt(self, params):
         """Generate a prompt for YouTube content creation guidance."""
@@ -317,70 +240,46 @@
             audience = params["audience"]
             length_minutes = params["length_minutes"]
             
-            logger.info(f"Creating content guidance prompt for topic: {topic}")
+            logger.info("Creating content guidance prompt for topic: %s", topic)
             
-            return {
-                "messages": [{
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"I'm planning to create a YouTube video about '{topic}' for an audience described as '{audience}'. The video will be approximately {length_minutes} minutes long.\n\n"
-                               f"Please provide comprehensive guidance for creating this YouTube video, including:\n\n"
-                               f"1. Title suggestions that would perform well in search and attract clicks\n"
-                               f"2. A recommended video structure with timeframes for each section\n"
-                               f"3. Key points to cover based on the topic and audience\n"
-                               f"4. Thumbnail design recommendations\n"
-                               f"5. Description template with SEO considerations\n"
-                               f"6. Tag suggestions\n"
-                               f"7. Hooks and engagement strategies for the first 30 seconds\n"
-                               f"8. Ideas for calls-to-action\n"
-                               f"9. Potential B-roll/visual suggestions\n"
-                               f"10. Common pitfalls to avoid for this type of content\n\n"
-                               f"Please be specific and provide actionable guidance that will help me create a high-quality, engaging YouTube video for my target audience."
-                    }
-                }]
-            }
+            return self._msg(self._CONTENT_GUIDANCE_TEMPLATE.format(
+                topic=topic, audience=audience, length_minutes=length_minutes
+            ))
         except Exception as e:
-            logger.error(f"Error creating content guidance prompt: {e}")
-            return {
-                "messages": [{
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"I was going to request guidance for creating YouTube content about '{topic}', but encountered an error: {str(e)}"
-                    }
-                }]
-            }
+            logger.error("Error creating content guidance prompt: %s", e)
+            return self._msg(f"I was going to request guidance for creating YouTube content about '{topic}', but encountered an error: {str(e)}")
     
     async def _get_video_metadata_resource(self, uri, params):
         """Resource handler for video metadata."""
         try:
             video_id = params["video_id"]
-            logger.info(f"Getting video metadata resource for: {video_id}")
+            logger.info("Getting video metadata resource for: %s", video_id)
             
-            # Check if we already have the video data
-            if video_id not in self.youtube_collector.video_data:
-                # Load the video data
-                self.youtube_collector.load_data_from_ids([video_id])
+            # Load the video data if we don't already have it
+            await self._load_videos([video_id])
             
             # Get the video data
-            if video_id in self.youtube_collector.video_data:
-                video_data = self.youtube_collector.video_data[video_id]
-                if isinstance(video_data, list):
-                    video_data = video_data[-1]  # Get the most recent data
-                
+            video_data = self._get_latest_video(video_id)
+            if video_data is not None:
                 # Format the metadata as a text resource
-                metadata_text = f"# Video: {video_data.get('title', '')}\n\n"
-                metadata_text += f"Video ID: {video_id}\n"
-                metadata_text += f"URL: {video_data.get('url', f'https://www.youtube.com/watch?v={video_id}')}\n"
-                metadata_text += f"Upload Date: {video_data.get('upload_date', '')}\n"
-                metadata_text += f"View Count: {video_data.get('view_count', 0)}\n"
-                metadata_text += f"Like Count: {video_data.get('like_count', 0)}\n"
-                metadata_text += f"Comment Count: {video_data.get('comment_count', 0)}\n\n"
-                metadata_text += f"## Description\n\n{video_data.get('description', '')}\n\n"
+                get = video_data.get
+                url = get('url', f'https://www.youtube.com/watch?v={video_id}')
+                parts = [
+                    f"# Video: {get('title', '')}\n\n"
+                    f"Video ID: {video_id}\n"
+                    f"URL: {url}\n"
+                    f"Upload Date: {get('upload_date', '')}\n"
+                    f"View Count: {get('view_count', 0)}\n"
+                    f"Like Count: {get('like_count', 0)}\n"
+                    f"Comment Count: {get('comment_count', 0)}\n\n"
+                    f"## Description\n\n{get('description', '')}\n\n"
+                ]
+                
+                tags = get('tags')
+                if tags:
+                    parts.append("## Tags\n\n" + ", ".join(tags) + "\n")
                 
-                if video_data.get('tags'):
-                    metadata_text += f"## Tags\n\n" + ", ".join(video_data.get('tags', [])) + "\n"
+                metadata_text = "".join(parts)
                 
                 return {
                     "contents": [{
@@ -396,7 +295,7 @@
                     }]
                 }
         except Exception as e:
-            logger.error(f"Error getting video metadata resource: {e}")
+            logger.error("Error getting video metadata resource: %s", e)
             return {
                 "contents": [{
                     "uri": uri.href,
@@ -408,7 +307,7 @@
         """Resource handler for channel information."""
         try:
             channel_id = params["channel_id"]
-            logger.info(f"Getting channel info resource for: {channel_id}")
+            logger.info("Getting channel info resource for: %s", channel_id)
             
             # Currently, the ytfunc project doesn't have a direct channel info method
             # So we'll construct a basic resource with what we can get
@@ -416,9 +315,9 @@
             # Try to get channel ID from identifier first
             resolved_channel_id = None
             try:
-                resolved_channel_id = self.youtube_collector.get_channel_id(channel_id)
+                resolved_channel_id = await asyncio.to_thread(self.youtube_collector.get_channel_id, channel_id)
             except Exception as e:
-                logger.warning(f"Failed to resolve channel ID: {e}")
+                logger.warning("Failed to resolve channel ID: %s", e)
                 resolved_channel_id = channel_id
             
             # Ideally, we'd query the YouTube API for channel details
@@ -442,7 +341,7 @@
                 }]
             }
         except Exception as e:
-            logger.error(f"Error getting channel info resource: {e}")
+            logger.error("Error getting channel info resource: %s", e)
             return {
                 "contents": [{
                     "uri": uri.href,
@@ -454,19 +353,18 @@
         """Resource handler for video transcript."""
         try:
             video_id = params["video_id"]
-            logger.info(f"Getting transcript resource for video: {video_id}")
+            logger.info("Getting transcript resource for video: %s", video_id)
             
             # Get transcript for the video
-            transcripts = self.youtube_collector.get_transcripts([video_id])
+            transcripts = await asyncio.to_thread(self.youtube_collector.get_transcripts, [video_id])
             
-            if video_id in transcripts and transcripts[video_id]:
+            segments = transcripts.get(video_id)
+            if segments:
                 # Format the transcript
-                transcript_text = f"# Transcript for video: {video_id}\n\n"
-                
-                for segment in transcripts[video_id]:
-                    start_time = self._format_time(segment.get("start", 0))
-                    text = segment.get("text", "")
-                    transcript_text += f"[{start_time}] {text}\n"
+                transcript_text = (
+                    f"# Transcript for video: {video_id}\n\n"
+                    + self._render_transcript(segments)
+                )
                 
                 return {
                     "contents": [{
@@ -482,7 +380,7 @@
                     }]
                 }
         except Exception as e:
-            logger.error(f"Error getting transcript resource: {e}")
+            logger.error("Error getting transcript resource: %s", e)
             return {
                 "contents": [{
                     "uri": uri.href,
@@ -490,19 +388,111 @@
                 }]
             }
     
-    def _truncate_text(self, text: str, max_length: int) -> str:
+    async def _load_videos(self, video_ids):
+        """Ensure data for the given videos is loaded into the collector.
+        
+        Missing ids are queued and loaded by a single load_data_from_ids call
+        per _VIDEO_LOAD_WINDOW, so concurrent prompt and resource requests for
+        different videos share one API round-trip. An id that is already
+        queued or being loaded is waited for rather than loaded again.
+        """
+        video_data = self.youtube_collector.video_data
+        missing_ids = [video_id for video_id in video_ids if video_id not in video_data]
+        if not missing_ids:
+            return
+        
+        loop = asyncio.get_running_loop()
+        futures_by_id = self._video_load_futures
+        if futures_by_id is None:
+            futures_by_id = self._video_load_futures = {}
+        futures = []
+        for video_id in missing_ids:
+            future = futures_by_id.get(video_id)
+            if future is None:
+                future = futures_by_id[video_id] = loop.create_future()
+                if self._queued_video_ids is None:
+                    self._queued_video_ids = []
+                    self._video_load_task = loop.create_task(self._flush_video_loads())
+                self._queued_video_ids.append(video_id)
+            futures.append(future)
+        
+        # Shield the shared futures so one cancelled caller doesn't fail the others
+        await asyncio.gather(*(asyncio.shield(future) for future in futures))
+    
+    async def _flush_video_loads(self):
+        """Load all queued video ids with one collector call.
+        
+        The futures of the batch are always resolved on the way out: with the
+        load error, or cancelled if this task is cancelled (e.g. at shutdown),
+        so no caller is left waiting.
+        """
+        video_ids = []
+        error = None
+        try:
+            try:
+                await asyncio.sleep(self._VIDEO_LOAD_WINDOW)
+            finally:
+                # Requests from here on start the next batch
+                video_ids = self._queued_video_ids or []
+                self._queued_video_ids = None
+                self._video_load_task = None
+            await asyncio.to_thread(self.youtube_collector.load_data_from_ids, video_ids)
+        except asyncio.CancelledError as e:
+            error = e
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            futures_by_id = self._video_load_futures
+            for video_id in video_ids:
+                future = futures_by_id.pop(video_id, None)
+                if future is None or future.done():
+                    continue
+                if isinstance(error, asyncio.CancelledError):
+                    future.cancel()
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(None)
+    
+    def _get_latest_video(self, video_id: str):
+        """Return the most recent data dict for a video, or None if not loaded.
+        
+        The collector stores either a single dict or a history list per video.
+        This is the only place that unwraps it, so each handler pays for the
+        check once per request.
+        """
+        video_data = self.youtube_collector.video_data.get(video_id)
+        if isinstance(video_data, list):
+            return video_data[-1] if video_data else None
+        return video_data
+    
+    def _render_transcript(self, segments: list) -> str:
+        """Render transcript segments as "[time] text" lines."""
+        parts = []
+        for segment in segments:
+            start_time = self._format_time(segment.get("start", 0))
+            text = segment.get("text", "")
+            parts.append(f"[{start_time}] {text}\n")
+        return "".join(parts)
+    
+    @staticmethod
+    def _truncate_text(text: str, max_length: int = 200) -> str:
         """Truncate text to a maximum length with ellipsis."""
         if not text:
             return ""
-        if len(text) <= max_length:
-            return text
-        return text[:max_length] + "..."
+        return text[:max_length] + "..." if len(text) > max_length else text
+    
+    @staticmethod
+    def _msg(text: str) -> dict:
+        """Wrap text as a single user message prompt result."""
+        return {"messages": [{"role": "user", "content": {"type": "text", "text": text}}]}
     
-    def _format_time(self, seconds: float) -> str:
+    @staticmethod
+    def _format_time(seconds: float) -> str:
         """Format seconds as a time string (HH:MM:SS)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
         
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{secs:02d}"
@@ -526,7 +516,7 @@ def main():
         server = YouTubeMcpServer()
         server.start()
     except Exception as e:
-        logger.error(f"Error starting YouTube MCP server: {e}")
+        logger.error("Error starting YouTube MCP server: %s", e)
         sys.exit(1)
 
 
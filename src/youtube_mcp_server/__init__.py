@@ -8,6 +8,8 @@ __version__ = "0.1.0"
 __author__ = "YouTube MCP Team"
 __description__ = "YouTube Analytics MCP Server"
 
+from importlib import import_module
+
 # Core imports
 from .core.config import YouTubeMCPConfig, Config
 from .core.exceptions import (
@@ -17,15 +19,21 @@ from .core.exceptions import (
     ValidationError,
 )
 
-# Tools
-from .tools.core_tools import YouTubeMCPTools
-from .tools.youtube_api_client import YouTubeAPIClient
-from .tools.video_downloader import VideoDownloader
-
-# Infrastructure
-from .infrastructure.cache_manager import CacheManager, ErrorHandler
-from .infrastructure.rate_limiter import RateLimiter
-from .infrastructure.retry_manager import RetryManager
+# Tools and infrastructure are imported lazily on first attribute access
+# (PEP 562) so that importing the package does not pull in the Google API
+# client, yt-dlp and friends.
+_LAZY_IMPORTS = {
+    # Tools
+    "YouTubeMCPTools": (".tools.core_tools", "YouTubeMCPTools"),
+    "YouTubeAPIClient": (".tools.youtube_api_client", "YouTubeAPIClient"),
+    "VideoDownloader": (".tools.video_downloader", "VideoDownloader"),
+    
+    # Infrastructure
+    "CacheManager": (".infrastructure.cache_manager", "CacheManager"),
+    "ErrorHandler": (".infrastructure.cache_manager", "ErrorHandler"),
+    "RateLimiter": (".infrastructure.rate_limiter", "RateLimiter"),
+    "RetryManager": (".infrastructure.retry_manager", "RetryManager"),
+}
 
 __all__ = [
     # Core
@@ -50,6 +58,24 @@ __all__ = [
     "ErrorHandler",
 ]
 
+
+def __getattr__(name: str):
+    """Resolve lazily imported public names on first access."""
+    try:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    value = getattr(import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir() output."""
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
+
 def get_version() -> str:
     """Get the current version of the package."""
     return __version__
\ No newline at end of file
@@ -4,16 +4,79 @@ Configuration management for YouTube MCP server.
 Adapted from existing config.py with MCP-specific enhancements.
 """
 
-import os
+import hashlib
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from urllib.parse import urlsplit
+from typing import Optional, Dict, Any, List, Mapping, FrozenSet
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, validator
-from pydantic_settings import BaseSettings
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# .env locations in lookup order; the first one that exists is loaded.
+# The repository paths are resolved once at import.
+_MODULE_DIR = Path(__file__).resolve().parent
+_ENV_FILE_CANDIDATES = (
+    Path(".env"),
+    Path("../.env"),
+    _MODULE_DIR.parents[2] / ".env",
+    _MODULE_DIR.parents[3] / ".env",
+)
+
+# Set once _load_environment has run
+_ENVIRONMENT_LOADED = False
+
+_VALID_LOG_LEVELS = frozenset(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+
+# Set once _setup_logging has run, so later config instances skip it
+_LOGGING_CONFIGURED = False
+
+# SHA-256 digests of the credential pairs already checked by
+# _validate_configuration; the raw API key is not kept
+_VALIDATED_CREDENTIALS = set()
+
+# Feature name accepted by is_feature_enabled() -> config field holding the flag
+_FEATURE_FLAG_FIELDS = {
+    "caching": "enable_caching",
+    "rate_limiting": "enable_rate_limiting",
+    "analytics": "enable_analytics",
+    "downloads": "enable_downloads",
+    "advanced_trimming": "enable_advanced_trimming",
+    "scene_detection": "enable_scene_detection",
+    "audio_analysis": "enable_audio_analysis",
+    "gpu_acceleration": "enable_gpu_acceleration",
+}
+
+
+def _load_environment(force: bool = False) -> None:
+    """Export the first .env file found into os.environ.
+    
+    Its values override the process environment, and code that reads
+    os.environ directly (ENABLE_VISUALIZATION, FORCE_CPU, TORCH_DEVICE) sees
+    them too. Runs once per process unless ``force`` is set.
+    """
+    global _ENVIRONMENT_LOADED
+    if _ENVIRONMENT_LOADED and not force:
+        return
+    _ENVIRONMENT_LOADED = True
+    
+    for env_path in _ENV_FILE_CANDIDATES:
+        if env_path.exists():
+            load_dotenv(env_path, override=True)
+            break
+
+
+def _ensure_dir(path: str) -> Path:
+    """Create a directory if it is missing and return it as a Path."""
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
 
 class YouTubeMCPConfig(BaseSettings):
     """
@@ -23,8 +86,11 @@ class YouTubeMCPConfig(BaseSettings):
     """
     
     # API Keys
-    google_api_key: Optional[str] = Field(None, env="GOOGLE_API_KEY") 
-    service_account_file: Optional[str] = Field(None, env="SERVICE_ACCOUNT_FILE")
+    # Read from GOOGLE_API_KEY / SERVICE_ACCOUNT_FILE (env names match case-insensitively)
+    google_api_key: Optional[str] = Field(None)
+    service_account_file: Optional[str] = Field(None)
+    organization_id: str = Field("", description="Google Cloud organization ID (legacy)")
+    project_id: str = Field("", description="Google Cloud project ID (legacy)")
     
     # YouTube API Configuration
     youtube_api_quota_limit: int = Field(10000, description="Daily YouTube API quota limit")
@@ -88,47 +154,51 @@ class YouTubeMCPConfig(BaseSettings):
         description="Allowed domains for video URLs"
     )
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        extra = "ignore"  # Allow extra environment variables
-        
-    @validator("service_account_file")
-    def validate_service_account_file(cls, v):
-        """Validate that service account file exists if provided."""
-        if v and not Path(v).exists():
-            # Only warn if explicitly set, ignore if from environment
-            pass
-        return v
-    
-    @validator("logging_level")
+    model_config = SettingsConfigDict(
+        # __init__ exports the first .env found into os.environ beforehand
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",  # Allow extra environment variables
+    )
+    
+    def __init__(self, **values: Any) -> None:
+        # Export .env before the fields are read from the environment
+        _load_environment()
+        super().__init__(**values)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Sections cached from the old value would be stale
+        if name in type(self).model_fields:
+            instance_dict = self.__dict__
+            for cached in _CACHED_SECTIONS:
+                instance_dict.pop(cached, None)
+    
+    @field_validator("logging_level", mode="after")
+    @classmethod
     def validate_logging_level(cls, v):
         """Validate logging level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Invalid logging level: {v}. Must be one of {valid_levels}")
-        return v.upper()
+        level = v.upper()
+        if level not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Invalid logging level: {v}. Must be one of {sorted(_VALID_LOG_LEVELS)}")
+        return level
     
     def model_post_init(self, __context) -> None:
-        """Post-initialization setup."""
-        self._load_environment()
-        self._validate_configuration()
-        self._setup_logging()
-    
-    def _load_environment(self) -> None:
-        """Load environment variables from multiple locations."""
-        env_paths = [
-            Path('.env'),
-            Path('../.env'),
-            Path(__file__).parent.parent.parent.parent / '.env',
-            Path(__file__).parent.parent.parent.parent.parent / '.env',
-        ]
+        """Post-initialization setup.
         
-        for env_path in env_paths:
-            if env_path.exists():
-                load_dotenv(env_path, override=True)
-                break
+        Validation only depends on the credentials, so re-creating the config
+        with the same ones (e.g. reload_config) skips it.
+        """
+        credentials = hashlib.sha256(
+            repr((self.google_api_key, self.service_account_file)).encode()
+        ).digest()
+        if credentials not in _VALIDATED_CREDENTIALS:
+            self._validate_configuration()
+            _VALIDATED_CREDENTIALS.add(credentials)
+        # Every component writes below the output directory
+        _ensure_dir(self.output_directory)
+        self._setup_logging()
     
     def _validate_configuration(self) -> None:
         """Validate the configuration."""
@@ -136,74 +206,112 @@ class YouTubeMCPConfig(BaseSettings):
         if not self.google_api_key and not self.service_account_file:
             logger.warning("Neither GOOGLE_API_KEY nor SERVICE_ACCOUNT_FILE is configured")
         
-        if self.google_api_key:
-            logger.info(f"Google API key configured: {self.google_api_key[:8]}...")
+        if logger.isEnabledFor(logging.INFO):
+            if self.google_api_key:
+                logger.info("Google API key configured: %s...", self.google_api_key[:8])
+            
+            # A missing file is reported by the auth code that opens it
+            if self.service_account_file:
+                logger.info("Service account file: %s", self.service_account_file)
         
-        if self.service_account_file and Path(self.service_account_file).exists():
-            logger.info(f"Service account file: {self.service_account_file}")
-        
-        # Create directories
-        Path(self.cache_directory).mkdir(parents=True, exist_ok=True)
-        Path(self.download_directory).mkdir(parents=True, exist_ok=True)
-        Path(self.output_directory).mkdir(parents=True, exist_ok=True)
-        Path(self.temp_processing_dir).mkdir(parents=True, exist_ok=True)
-        Path(self.model_cache_dir).mkdir(parents=True, exist_ok=True)
+        # Feature directories are created on first use by the get_*_config()
+        # accessors (and by the components that own them), so disabled
+        # features don't touch the filesystem.
     
     def _setup_logging(self) -> None:
-        """Setup logging configuration."""
-        # For MCP servers, send logs to stderr and reduce verbosity
-        import sys
+        """Setup logging configuration (once per process)."""
+        global _LOGGING_CONFIGURED
+        if _LOGGING_CONFIGURED:
+            return
+        
+        # For MCP servers, send logs to stderr and reduce verbosity.
+        # force=True replaces any handler installed earlier, which could
+        # write to stdout, the MCP stdio channel.
         logging.basicConfig(
             level=logging.WARNING,  # Reduce logging for MCP
             format=self.logging_format,
             stream=sys.stderr,  # Ensure logs go to stderr
             force=True
         )
+        _LOGGING_CONFIGURED = True
     
-    def get_youtube_api_config(self) -> Dict[str, Any]:
-        """Get YouTube API configuration."""
-        return {
+    @cached_property
+    def youtube_api_config(self) -> Mapping[str, Any]:
+        """YouTube API configuration (built once, read-only)."""
+        return MappingProxyType({
             "api_key": self.google_api_key,
             "service_account_file": self.service_account_file,
             "quota_limit": self.youtube_api_quota_limit,
             "rate_limit": self.youtube_api_rate_limit,
-        }
+        })
     
-    def get_cache_config(self) -> Dict[str, Any]:
-        """Get cache configuration."""
-        return {
+    def get_youtube_api_config(self) -> Mapping[str, Any]:
+        """Get YouTube API configuration."""
+        return self.youtube_api_config
+    
+    @cached_property
+    def cache_config(self) -> Mapping[str, Any]:
+        """Cache configuration (built once, read-only)."""
+        if self.enable_caching:
+            _ensure_dir(self.cache_directory)
+        return MappingProxyType({
             "cache_dir": self.cache_directory,
             "ttl_seconds": self.cache_ttl_seconds,
             "enabled": self.enable_caching,
-        }
+        })
     
-    def get_rate_limit_config(self) -> Dict[str, Any]:
-        """Get rate limiting configuration."""
-        return {
+    def get_cache_config(self) -> Mapping[str, Any]:
+        """Get cache configuration."""
+        return self.cache_config
+    
+    @cached_property
+    def rate_limit_config(self) -> Mapping[str, Any]:
+        """Rate limiting configuration (built once, read-only)."""
+        return MappingProxyType({
             "tokens_per_second": self.rate_limit_tokens_per_second,
             "bucket_size": self.rate_limit_bucket_size,
             "enabled": self.enable_rate_limiting,
-        }
+        })
     
-    def get_retry_config(self) -> Dict[str, Any]:
-        """Get retry configuration."""
-        return {
+    def get_rate_limit_config(self) -> Mapping[str, Any]:
+        """Get rate limiting configuration."""
+        return self.rate_limit_config
+    
+    @cached_property
+    def retry_config(self) -> Mapping[str, Any]:
+        """Retry configuration (built once, read-only)."""
+        return MappingProxyType({
             "max_retries": self.max_retries,
             "base_delay": self.retry_base_delay,
             "max_delay": self.retry_max_delay,
-        }
+        })
     
-    def get_download_config(self) -> Dict[str, Any]:
-        """Get download configuration."""
-        return {
+    def get_retry_config(self) -> Mapping[str, Any]:
+        """Get retry configuration."""
+        return self.retry_config
+    
+    @cached_property
+    def download_config(self) -> Mapping[str, Any]:
+        """Download configuration (built once, read-only)."""
+        if self.enable_downloads:
+            _ensure_dir(self.download_directory)
+        return MappingProxyType({
             "download_dir": self.download_directory,
             "max_concurrent": self.max_concurrent_downloads,
             "enabled": self.enable_downloads,
-        }
+        })
     
-    def get_advanced_trimming_config(self) -> Dict[str, Any]:
-        """Get advanced trimming configuration."""
-        return {
+    def get_download_config(self) -> Mapping[str, Any]:
+        """Get download configuration."""
+        return self.download_config
+    
+    @cached_property
+    def advanced_trimming_config(self) -> Mapping[str, Any]:
+        """Advanced trimming configuration (built once, read-only)."""
+        if self.enable_advanced_trimming:
+            _ensure_dir(self.temp_processing_dir)
+            _ensure_dir(self.model_cache_dir)
+        return MappingProxyType({
             "enabled": self.enable_advanced_trimming,
             "whisper_model_size": self.whisper_model_size,
             "scene_detection_threshold": self.scene_detection_threshold,
@@ -214,74 +322,150 @@ class YouTubeMCPConfig(BaseSettings):
             "max_video_length": self.max_video_length_for_analysis,
             "temp_processing_dir": self.temp_processing_dir,
             "model_cache_dir": self.model_cache_dir,
-        }
+        })
     
-    def get_server_config(self) -> Dict[str, Any]:
-        """Get server configuration."""
-        return {
+    def get_advanced_trimming_config(self) -> Mapping[str, Any]:
+        """Get advanced trimming configuration."""
+        return self.advanced_trimming_config
+    
+    @cached_property
+    def server_config(self) -> Mapping[str, Any]:
+        """Server configuration (built once, read-only)."""
+        return MappingProxyType({
             "host": self.server_host,
             "port": self.server_port,
             "debug": self.server_debug,
-        }
+        })
+    
+    def get_server_config(self) -> Mapping[str, Any]:
+        """Get server configuration."""
+        return self.server_config
+    
+    @cached_property
+    def feature_flags(self) -> FrozenSet[str]:
+        """Names of the enabled features (built once)."""
+        return frozenset(
+            feature for feature, field in _FEATURE_FLAG_FIELDS.items()
+            if getattr(self, field)
+        )
     
     def is_feature_enabled(self, feature: str) -> bool:
         """Check if a feature is enabled."""
-        feature_flags = {
-            "caching": self.enable_caching,
-            "rate_limiting": self.enable_rate_limiting,
-            "analytics": self.enable_analytics,
-            "downloads": self.enable_downloads,
-            "advanced_trimming": self.enable_advanced_trimming,
-            "scene_detection": self.enable_scene_detection,
-            "audio_analysis": self.enable_audio_analysis,
-            "gpu_acceleration": self.enable_gpu_acceleration,
-        }
-        return feature_flags.get(feature, False)
+        return feature in self.feature_flags
+    
+    @cached_property
+    def allowed_domain_set(self) -> FrozenSet[str]:
+        """Lower-cased allowed domains for hashed lookups (built once)."""
+        return frozenset(domain.lower() for domain in self.allowed_domains)
+    
+    def is_allowed_url(self, url: str) -> bool:
+        """Check whether a URL (or bare host) belongs to an allowed domain.
+        
+        Subdomains of an allowed domain are accepted, e.g. m.youtube.com for
+        youtube.com. Each dot-suffix of the host is checked against
+        allowed_domain_set, so the cost depends on the host, not the list.
+        """
+        try:
+            host = urlsplit(url).hostname if "://" in url else url.split("/", 1)[0].split(":", 1)[0]
+        except ValueError:
+            # Malformed URL, e.g. an unclosed IPv6 bracket
+            return False
+        if not host:
+            return False
+        
+        domains = self.allowed_domain_set
+        host = host.lower()
+        while True:
+            if host in domains:
+                return True
+            _, dot, host = host.partition(".")
+            if not dot:
+                return False
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
         return self.model_dump()
 
 
+# cached_property sections of YouTubeMCPConfig, dropped when a field is assigned
+_CACHED_SECTIONS = tuple(
+    name for name, attr in vars(YouTubeMCPConfig).items()
+    if isinstance(attr, cached_property)
+)
+
+
 # Legacy Config class for backward compatibility
 class Config:
-    """Legacy configuration class for backward compatibility."""
+    """Legacy configuration class for backward compatibility.
+    
+    Attributes delegate to the shared YouTubeMCPConfig from get_config(), so
+    constructing one no longer builds and validates a second configuration.
+    """
+    
+    # NLP Models (for backward compatibility)
+    SPACY_MODEL = "en_core_web_sm"
+    NLTK_RESOURCES = ["punkt", "averaged_perceptron_tagger", "stopwords"]
+    
+    # Visualization Config (legacy)
+    MAX_OPEN_FIGURES = 150
     
     def __init__(self):
-        # Create the new config
-        self._config = YouTubeMCPConfig()
-        
-        # Set legacy attributes
-        self.google_api_key = self._config.google_api_key
-        self.GOOGLE_API_KEY = self.google_api_key
-        self.service_account_file = self._config.service_account_file
-        self.SERVICE_ACCOUNT_FILE = self.service_account_file
-        self.organization_id = os.getenv("ORGANIZATION_ID", "")
-        self.project_id = os.getenv("PROJECT_ID", "")
-        
-        # NLP Models (for backward compatibility)
-        self.SPACY_MODEL = "en_core_web_sm"
-        self.NLTK_RESOURCES = ["punkt", "averaged_perceptron_tagger", "stopwords"]
-        
-        # Logging (legacy)
-        self.LOGGING_LEVEL = self._config.logging_level
-        self.LOGGING_FORMAT = self._config.logging_format
-        
-        # Visualization Config (legacy)
-        self.MAX_OPEN_FIGURES = 150
+        self._config = get_config()
+    
+    @property
+    def google_api_key(self) -> Optional[str]:
+        return self._config.google_api_key
+    
+    GOOGLE_API_KEY = google_api_key
+    
+    @property
+    def service_account_file(self) -> Optional[str]:
+        return self._config.service_account_file
+    
+    SERVICE_ACCOUNT_FILE = service_account_file
+    
+    @property
+    def organization_id(self) -> str:
+        return self._config.organization_id
+    
+    @property
+    def project_id(self) -> str:
+        return self._config.project_id
+    
+    # Logging (legacy)
+    @property
+    def LOGGING_LEVEL(self) -> str:
+        return self._config.logging_level
+    
+    @property
+    def LOGGING_FORMAT(self) -> str:
+        return self._config.logging_format
 
 
-# Global configuration instance
-config = YouTubeMCPConfig()
+# Global configuration instance, created on first use by get_config()
+_config: Optional[YouTubeMCPConfig] = None
 
 
 def get_config() -> YouTubeMCPConfig:
     """Get the global configuration instance."""
-    return config
+    global _config
+    if _config is None:
+        _config = YouTubeMCPConfig()
+    return _config
 
 
 def reload_config() -> YouTubeMCPConfig:
     """Reload the configuration."""
-    global config
-    config = YouTubeMCPConfig()
-    return config
\ No newline at end of file
+    global _config
+    # Pick up edits to .env since it was last read
+    _load_environment(force=True)
+    _config = YouTubeMCPConfig()
+    return _config
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from .config import config` working without building the
+    # configuration at import time.
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
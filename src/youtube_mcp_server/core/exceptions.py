@@ -5,13 +5,73 @@ Provides comprehensive error handling with specific exception types for differen
 failure scenarios, enabling proper error recovery and user feedback.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from __future__ import annotations
+
+import math
+import os
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+
+if TYPE_CHECKING:
+    import logging
+    from datetime import datetime
+    from types import TracebackType
+
+# Format the timestamp when an error is created rather than in to_dict();
+# suits servers that serialise nearly every error they raise
+_EAGER_ISO = os.environ.get("YTMCP_EAGER_ISO", "1") == "1"
+
+# (whole second, ISO string of that second) for the most recent error timestamp
+_ISO_CACHE: Tuple[int, str] = (0, "")
+
+
+def _isoformat(ts: float) -> str:
+    """Format an epoch timestamp like datetime.fromtimestamp(ts).isoformat().
+    
+    The formatted date and time are reused while errors keep landing in the
+    same second; only the microseconds are formatted per call.
+    """
+    global _ISO_CACHE
+    
+    # Split and round the same way datetime.fromtimestamp does
+    frac, whole = math.modf(ts)
+    us = round(frac * 1e6)
+    if us >= 1000000:
+        us -= 1000000
+        whole += 1
+    elif us < 0:
+        us += 1000000
+        whole -= 1
+    sec = int(whole)
+    
+    cached_sec, iso = _ISO_CACHE
+    if cached_sec != sec or not iso:
+        from datetime import datetime
+        iso = datetime.fromtimestamp(sec).isoformat()
+        _ISO_CACHE = (sec, iso)
+    return f"{iso}.{us:06d}" if us else iso
 
 
 class YouTubeMCPError(Exception):
     """Base exception class for all YouTube MCP Server errors."""
     
+    __slots__ = ("message", "error_code", "details", "recoverable", "_ts", "_iso")
+    
+    # Class name, used as the error code when none is given and as error_type
+    _default_error_code: str = "YouTubeMCPError"
+    # Slots added by subclasses, carried as pickle state by __reduce__
+    _extra_slots: Tuple[str, ...] = ()
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._default_error_code = cls.__name__
+        cls._extra_slots = tuple(
+            name
+            for klass in reversed(cls.__mro__[:cls.__mro__.index(YouTubeMCPError)])
+            for name in klass.__dict__.get("__slots__", ())
+        )
+    
     def __init__(
         self,
         message: str,
@@ -30,34 +90,81 @@ class YouTubeMCPError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.error_code = error_code or self.__class__.__name__
+        self.error_code = error_code or self._default_error_code
         self.details = details or {}
         self.recoverable = recoverable
-        self.timestamp = datetime.now()
+        self._ts = ts = time.time()
+        self._iso = _isoformat(ts) if _EAGER_ISO else None
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Local time at which the error was created."""
+        from datetime import datetime
+        return datetime.fromtimestamp(self._ts)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary format."""
         return {
-            "error_type": self.__class__.__name__,
+            "error_type": type(self)._default_error_code,
             "error_code": self.error_code,
             "message": self.message,
             "details": self.details,
             "recoverable": self.recoverable,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._iso or _isoformat(self._ts),
         }
     
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuild from the stored fields rather than re-running the subclass
+        # __init__, whose signature doesn't match self.args
+        args = (type(self), self.message, self.error_code, self.details or None, self.recoverable, self._ts)
+        # Subclass slots and the instance __dict__ (attributes set on
+        # non-slotted subclasses, __notes__) travel as the pickle state
+        state = dict(getattr(self, "__dict__", None) or ())
+        for name in self._extra_slots:
+            state[name] = getattr(self, name, None)
+        if not state:
+            return _reconstruct, args
+        return _reconstruct, args, state
+    
     def __str__(self) -> str:
         if self.details:
             return f"{self.message} (Code: {self.error_code}, Details: {self.details})"
         return f"{self.message} (Code: {self.error_code})"
 
 
+def _reconstruct(
+    cls: Type[YouTubeMCPError],
+    message: str,
+    error_code: str,
+    details: Optional[Dict[str, Any]],
+    recoverable: bool,
+    ts: float,
+) -> YouTubeMCPError:
+    """Unpickle an error without calling its __init__."""
+    error = cls.__new__(cls, message)
+    error.message = message
+    error.error_code = error_code
+    error.details = details or {}
+    error.recoverable = recoverable
+    error._ts = ts
+    error._iso = _isoformat(ts) if _EAGER_ISO else None
+    return error
+
+
 class ConfigurationError(YouTubeMCPError):
     """Raised when there are configuration issues."""
     
-    def __init__(self, message: str, config_section: Optional[str] = None, **kwargs):
-        details = kwargs.pop("details", {})
+    __slots__ = ()
+    
+    def __init__(
+        self,
+        message: str,
+        config_section: Optional[str] = None,
+        *,
+        details: Optional[Dict[str, Any]] = None,
+    ):
         if config_section:
+            details = details or {}
             details["config_section"] = config_section
         
         super().__init__(
@@ -65,16 +172,23 @@ class ConfigurationError(YouTubeMCPError):
             error_code="CONFIG_ERROR",
             details=details,
             recoverable=False,
-            **kwargs
         )
 
 
 class AuthenticationError(YouTubeMCPError):
     """Raised when authentication fails."""
     
-    def __init__(self, message: str, auth_type: Optional[str] = None, **kwargs):
-        details = kwargs.pop("details", {})
+    __slots__ = ()
+    
+    def __init__(
+        self,
+        message: str,
+        auth_type: Optional[str] = None,
+        *,
+        details: Optional[Dict[str, Any]] = None,
+    ):
         if auth_type:
+            details = details or {}
             details["auth_type"] = auth_type
         
         super().__init__(
@@ -82,27 +196,31 @@ class AuthenticationError(YouTubeMCPError):
             error_code="AUTH_ERROR",
             details=details,
             recoverable=False,
-            **kwargs
         )
 
 
 class ValidationError(YouTubeMCPError):
     """Raised when input validation fails."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         field: Optional[str] = None,
         value: Optional[Any] = None,
         expected_type: Optional[str] = None,
-        **kwargs
+        *,
+        details: Optional[Dict[str, Any]] = None,
     ):
-        details = kwargs.pop("details", {})
         if field:
+            details = details or {}
             details["field"] = field
         if value is not None:
+            details = details or {}
             details["value"] = str(value)
         if expected_type:
+            details = details or {}
             details["expected_type"] = expected_type
         
         super().__init__(
@@ -110,49 +228,59 @@ class ValidationError(YouTubeMCPError):
             error_code="VALIDATION_ERROR",
             details=details,
             recoverable=True,
-            **kwargs
         )
 
 
 class YouTubeAPIError(YouTubeMCPError):
     """Base class for YouTube API-related errors."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         api_error_code: Optional[str] = None,
         http_status: Optional[int] = None,
         quota_cost: Optional[int] = None,
-        **kwargs
+        *,
+        details: Optional[Dict[str, Any]] = None,
+        recoverable: bool = True,
     ):
-        details = kwargs.pop("details", {})
         if api_error_code:
+            details = details or {}
             details["api_error_code"] = api_error_code
         if http_status:
+            details = details or {}
             details["http_status"] = http_status
         if quota_cost:
+            details = details or {}
             details["quota_cost"] = quota_cost
         
         super().__init__(
             message=message,
             error_code="YOUTUBE_API_ERROR",
             details=details,
-            **kwargs
+            recoverable=recoverable,
         )
 
 
 class QuotaExceededError(YouTubeAPIError):
     """Raised when YouTube API quota is exceeded."""
     
+    __slots__ = ("reset_time", "quota_used", "quota_limit")
+    
     def __init__(
         self,
         message: str = "YouTube API quota exceeded",
         reset_time: Optional[datetime] = None,
         quota_used: Optional[int] = None,
         quota_limit: Optional[int] = None,
-        **kwargs
+        *,
+        http_status: Optional[int] = None,
+        quota_cost: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
     ):
-        details = kwargs.pop("details", {})
+        details = details or {}
         if reset_time:
             details["reset_time"] = reset_time.isoformat()
         if quota_used:
@@ -160,117 +288,169 @@ class QuotaExceededError(YouTubeAPIError):
         if quota_limit:
             details["quota_limit"] = quota_limit
         
+        details["api_error_code"] = "quotaExceeded"
+        if http_status:
+            details["http_status"] = http_status
+        if quota_cost:
+            details["quota_cost"] = quota_cost
+        
         self.reset_time = reset_time
         self.quota_used = quota_used
         self.quota_limit = quota_limit
         
-        super().__init__(
-            message=message,
-            api_error_code="quotaExceeded",
-            details=details,
-            recoverable=True,
-            **kwargs
-        )
+        YouTubeMCPError.__init__(self, message, "YOUTUBE_API_ERROR", details, True)
 
 
 class RateLimitExceededError(YouTubeAPIError):
     """Raised when YouTube API rate limit is exceeded."""
     
+    __slots__ = ("retry_after",)
+    
     def __init__(
         self,
         message: str = "YouTube API rate limit exceeded",
         retry_after: Optional[int] = None,
-        **kwargs
+        *,
+        http_status: Optional[int] = None,
+        quota_cost: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
     ):
-        details = kwargs.pop("details", {})
+        details = details or {}
         if retry_after:
             details["retry_after_seconds"] = retry_after
         
+        details["api_error_code"] = "rateLimitExceeded"
+        if http_status:
+            details["http_status"] = http_status
+        if quota_cost:
+            details["quota_cost"] = quota_cost
+        
         self.retry_after = retry_after
         
-        super().__init__(
-            message=message,
-            api_error_code="rateLimitExceeded",
-            details=details,
-            recoverable=True,
-            **kwargs
-        )
+        YouTubeMCPError.__init__(self, message, "YOUTUBE_API_ERROR", details, True)
 
 
 class VideoNotFoundError(YouTubeAPIError):
     """Raised when a requested video is not found or not accessible."""
     
-    def __init__(self, video_id: str, **kwargs):
+    __slots__ = ("video_id",)
+    
+    def __init__(
+        self,
+        video_id: str,
+        *,
+        http_status: Optional[int] = None,
+        quota_cost: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ):
         self.video_id = video_id
         
-        details = kwargs.pop("details", {})
-        details["video_id"] = video_id
+        details = {
+            **(details or {}),
+            "video_id": video_id,
+            "api_error_code": "videoNotFound",
+        }
+        if http_status:
+            details["http_status"] = http_status
+        if quota_cost:
+            details["quota_cost"] = quota_cost
         
-        super().__init__(
-            message=f"Video not found or not accessible: {video_id}",
-            api_error_code="videoNotFound",
-            details=details,
-            recoverable=False,
-            **kwargs
+        YouTubeMCPError.__init__(
+            self,
+            f"Video not found or not accessible: {video_id}",
+            "YOUTUBE_API_ERROR",
+            details,
+            False,
         )
 
 
 class ChannelNotFoundError(YouTubeAPIError):
     """Raised when a requested channel is not found or not accessible."""
     
-    def __init__(self, channel_id: str, **kwargs):
+    __slots__ = ("channel_id",)
+    
+    def __init__(
+        self,
+        channel_id: str,
+        *,
+        http_status: Optional[int] = None,
+        quota_cost: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ):
         self.channel_id = channel_id
         
-        details = kwargs.pop("details", {})
-        details["channel_id"] = channel_id
+        details = {
+            **(details or {}),
+            "channel_id": channel_id,
+            "api_error_code": "channelNotFound",
+        }
+        if http_status:
+            details["http_status"] = http_status
+        if quota_cost:
+            details["quota_cost"] = quota_cost
         
-        super().__init__(
-            message=f"Channel not found or not accessible: {channel_id}",
-            api_error_code="channelNotFound",
-            details=details,
-            recoverable=False,
-            **kwargs
+        YouTubeMCPError.__init__(
+            self,
+            f"Channel not found or not accessible: {channel_id}",
+            "YOUTUBE_API_ERROR",
+            details,
+            False,
         )
 
 
 class TranscriptNotAvailableError(YouTubeAPIError):
     """Raised when video transcript is not available."""
     
-    def __init__(self, video_id: str, languages: Optional[List[str]] = None, **kwargs):
+    __slots__ = ("video_id", "languages")
+    
+    def __init__(
+        self,
+        video_id: str,
+        languages: Optional[List[str]] = None,
+        *,
+        http_status: Optional[int] = None,
+        quota_cost: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ):
         self.video_id = video_id
         self.languages = languages or []
         
-        details = kwargs.pop("details", {})
-        details["video_id"] = video_id
-        details["requested_languages"] = self.languages
+        details = {
+            **(details or {}),
+            "video_id": video_id,
+            "requested_languages": self.languages,
+            "api_error_code": "transcriptNotAvailable",
+        }
+        if http_status:
+            details["http_status"] = http_status
+        if quota_cost:
+            details["quota_cost"] = quota_cost
         
         message = f"Transcript not available for video: {video_id}"
         if languages:
             message += f" (requested languages: {', '.join(languages)})"
         
-        super().__init__(
-            message=message,
-            api_error_code="transcriptNotAvailable",
-            details=details,
-            recoverable=False,
-            **kwargs
-        )
+        YouTubeMCPError.__init__(self, message, "YOUTUBE_API_ERROR", details, False)
 
 
 class CacheError(YouTubeMCPError):
     """Raised when cache operations fail."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         cache_key: Optional[str] = None,
         operation: Optional[str] = None,
-        **kwargs
+        *,
+        details: Optional[Dict[str, Any]] = None,
     ):
-        details = kwargs.pop("details", {})
         if cache_key:
+            details = details or {}
             details["cache_key"] = cache_key
         if operation:
+            details = details or {}
             details["operation"] = operation
         
         super().__init__(
@@ -278,24 +458,27 @@ class CacheError(YouTubeMCPError):
             error_code="CACHE_ERROR",
             details=details,
             recoverable=True,
-            **kwargs
         )
 
 
 class AnalysisError(YouTubeMCPError):
     """Raised when data analysis operations fail."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         analysis_type: Optional[str] = None,
         data_size: Optional[int] = None,
-        **kwargs
+        *,
+        details: Optional[Dict[str, Any]] = None,
     ):
-        details = kwargs.pop("details", {})
         if analysis_type:
+            details = details or {}
             details["analysis_type"] = analysis_type
         if data_size:
+            details = details or {}
             details["data_size"] = data_size
         
         super().__init__(
@@ -303,171 +486,195 @@ class AnalysisError(YouTubeMCPError):
             error_code="ANALYSIS_ERROR",
             details=details,
             recoverable=True,
-            **kwargs
         )
 
 
 class MLModelError(AnalysisError):
     """Raised when machine learning model operations fail."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         model_name: Optional[str] = None,
         model_version: Optional[str] = None,
-        **kwargs
+        *,
+        data_size: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+        recoverable: bool = True,
     ):
-        details = kwargs.pop("details", {})
+        details = details or {}
         if model_name:
             details["model_name"] = model_name
         if model_version:
             details["model_version"] = model_version
+        details["analysis_type"] = "machine_learning"
+        if data_size:
+            details["data_size"] = data_size
         
-        super().__init__(
-            message=message,
-            analysis_type="machine_learning",
-            error_code="ML_MODEL_ERROR",
-            details=details,
-            **kwargs
-        )
+        YouTubeMCPError.__init__(self, message, "ML_MODEL_ERROR", details, recoverable)
 
 
 class ComputerVisionError(AnalysisError):
     """Raised when computer vision operations fail."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         image_url: Optional[str] = None,
         operation: Optional[str] = None,
-        **kwargs
+        *,
+        data_size: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+        recoverable: bool = True,
     ):
-        details = kwargs.pop("details", {})
+        details = details or {}
         if image_url:
             details["image_url"] = image_url
         if operation:
             details["cv_operation"] = operation
+        details["analysis_type"] = "computer_vision"
+        if data_size:
+            details["data_size"] = data_size
         
-        super().__init__(
-            message=message,
-            analysis_type="computer_vision",
-            error_code="CV_ERROR",
-            details=details,
-            **kwargs
-        )
+        YouTubeMCPError.__init__(self, message, "CV_ERROR", details, recoverable)
 
 
 class TextAnalysisError(AnalysisError):
     """Raised when text analysis operations fail."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         text_length: Optional[int] = None,
         language: Optional[str] = None,
-        **kwargs
+        *,
+        data_size: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+        recoverable: bool = True,
     ):
-        details = kwargs.pop("details", {})
+        details = details or {}
         if text_length:
             details["text_length"] = text_length
         if language:
             details["language"] = language
+        details["analysis_type"] = "text_analysis"
+        if data_size:
+            details["data_size"] = data_size
         
-        super().__init__(
-            message=message,
-            analysis_type="text_analysis",
-            error_code="TEXT_ANALYSIS_ERROR",
-            details=details,
-            **kwargs
-        )
+        YouTubeMCPError.__init__(self, message, "TEXT_ANALYSIS_ERROR", details, recoverable)
 
 
 class DownloadError(YouTubeMCPError):
     """Raised when video download operations fail."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         video_id: Optional[str] = None,
         url: Optional[str] = None,
-        **kwargs
+        *,
+        details: Optional[Dict[str, Any]] = None,
+        recoverable: bool = True,
     ):
-        details = kwargs.pop("details", {})
         if video_id:
+            details = details or {}
             details["video_id"] = video_id
         if url:
+            details = details or {}
             details["url"] = url
         
         super().__init__(
             message=message,
             error_code="DOWNLOAD_ERROR",
             details=details,
-            **kwargs
+            recoverable=recoverable,
         )
 
 
 class ExportError(YouTubeMCPError):
     """Raised when data export operations fail."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         export_format: Optional[str] = None,
         file_path: Optional[str] = None,
-        **kwargs
+        *,
+        details: Optional[Dict[str, Any]] = None,
+        recoverable: bool = True,
     ):
-        details = kwargs.pop("details", {})
         if export_format:
+            details = details or {}
             details["export_format"] = export_format
         if file_path:
+            details = details or {}
             details["file_path"] = file_path
         
         super().__init__(
             message=message,
             error_code="EXPORT_ERROR",
             details=details,
-            **kwargs
+            recoverable=recoverable,
         )
 
 
 class NetworkError(YouTubeMCPError):
     """Raised when network operations fail."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         url: Optional[str] = None,
         status_code: Optional[int] = None,
-        **kwargs
+        *,
+        details: Optional[Dict[str, Any]] = None,
+        recoverable: bool = True,
     ):
-        details = kwargs.pop("details", {})
         if url:
+            details = details or {}
             details["url"] = url
         if status_code:
+            details = details or {}
             details["status_code"] = status_code
         
         super().__init__(
             message=message,
             error_code="NETWORK_ERROR",
             details=details,
-            **kwargs
+            recoverable=recoverable,
         )
 
 
 class TimeoutError(YouTubeMCPError):
     """Raised when operations timeout."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         timeout_seconds: Optional[float] = None,
         operation: Optional[str] = None,
-        **kwargs
+        *,
+        details: Optional[Dict[str, Any]] = None,
     ):
-        details = kwargs.pop("details", {})
         if timeout_seconds:
+            details = details or {}
             details["timeout_seconds"] = timeout_seconds
         if operation:
+            details = details or {}
             details["operation"] = operation
         
         super().__init__(
@@ -475,24 +682,27 @@ class TimeoutError(YouTubeMCPError):
             error_code="TIMEOUT_ERROR",
             details=details,
             recoverable=True,
-            **kwargs
         )
 
 
 class ResourceNotFoundError(YouTubeMCPError):
     """Raised when a requested resource is not found."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
         resource_type: Optional[str] = None,
         resource_id: Optional[str] = None,
-        **kwargs
+        *,
+        details: Optional[Dict[str, Any]] = None,
     ):
-        details = kwargs.pop("details", {})
         if resource_type:
+            details = details or {}
             details["resource_type"] = resource_type
         if resource_id:
+            details = details or {}
             details["resource_id"] = resource_id
         
         super().__init__(
@@ -500,7 +710,6 @@ class ResourceNotFoundError(YouTubeMCPError):
             error_code="RESOURCE_NOT_FOUND",
             details=details,
             recoverable=False,
-            **kwargs
         )
 
 
@@ -514,12 +723,30 @@ YOUTUBE_API_ERROR_MAPPING = {
     "unauthorized": AuthenticationError,
     "badRequest": ValidationError,
 }
+_YT_ERR_GET = YOUTUBE_API_ERROR_MAPPING.get
+
+
+# Error class mappings for HTTP status codes (5xx is handled separately)
+HTTP_ERROR_MAPPING: Dict[int, Type[YouTubeMCPError]] = {
+    400: ValidationError,
+    401: AuthenticationError,
+    403: QuotaExceededError,
+    404: ResourceNotFoundError,
+    429: RateLimitExceededError,
+}
+
+
+# Pre-built error codes for 4xx statuses that fall through to the generic error
+# (5xx statuses become NetworkError before this lookup)
+_HTTP_CODE_STRS: Dict[int, str] = {
+    status: sys.intern(f"HTTP_{status}") for status in range(400, 500)
+}
 
 
 def create_youtube_api_error(
     error_code: str,
     message: str,
-    **kwargs
+    **kwargs: Any
 ) -> YouTubeAPIError:
     """
     Create appropriate YouTube API error based on error code.
@@ -532,11 +759,17 @@ def create_youtube_api_error(
     Returns:
         Appropriate YouTubeAPIError subclass instance.
     """
-    error_class = YOUTUBE_API_ERROR_MAPPING.get(error_code, YouTubeAPIError)
-    return error_class(message, api_error_code=error_code, **kwargs)
+    error_class = _YT_ERR_GET(error_code, YouTubeAPIError)
+    if error_class is YouTubeAPIError:
+        return YouTubeAPIError(message, api_error_code=error_code, **kwargs)
+    if not issubclass(error_class, YouTubeAPIError):
+        # Auth and validation errors don't take api_error_code; keep it in details
+        kwargs["details"] = {**(kwargs.get("details") or {}), "api_error_code": error_code}
+    # Mapped YouTubeAPIError subclasses set their own code
+    return error_class(message, **kwargs)
 
 
-def handle_http_error(http_status: int, message: str, **kwargs) -> YouTubeMCPError:
+def handle_http_error(http_status: int, message: str, **kwargs: Any) -> YouTubeMCPError:
     """
     Create appropriate error based on HTTP status code.
     
@@ -548,20 +781,13 @@ def handle_http_error(http_status: int, message: str, **kwargs) -> YouTubeMCPErr
     Returns:
         Appropriate error instance.
     """
-    if http_status == 400:
-        return ValidationError(message, **kwargs)
-    elif http_status == 401:
-        return AuthenticationError(message, **kwargs)
-    elif http_status == 403:
-        return QuotaExceededError(message, **kwargs)
-    elif http_status == 404:
-        return ResourceNotFoundError(message, **kwargs)
-    elif http_status == 429:
-        return RateLimitExceededError(message, **kwargs)
-    elif 500 <= http_status < 600:
+    error_class = HTTP_ERROR_MAPPING.get(http_status)
+    if error_class is not None:
+        return error_class(message, **kwargs)
+    if 500 <= http_status < 600:
         return NetworkError(message, status_code=http_status, **kwargs)
-    else:
-        return YouTubeMCPError(message, error_code=f"HTTP_{http_status}", **kwargs)
+    error_code = _HTTP_CODE_STRS.get(http_status) or sys.intern(f"HTTP_{http_status}")
+    return YouTubeMCPError(message, error_code=error_code, **kwargs)
 
 
 # Exception context manager for error handling
@@ -573,7 +799,7 @@ class ErrorContext:
         operation: str,
         reraise: bool = True,
         default_return: Any = None,
-        logger = None,
+        logger: Optional[logging.Logger] = None,
     ):
         """
         Initialize error context.
@@ -588,35 +814,42 @@ class ErrorContext:
         self.reraise = reraise
         self.default_return = default_return
         self.logger = logger
-        self.error: Optional[Exception] = None
+        self.error: Optional[BaseException] = None
     
-    def __enter__(self):
+    def __enter__(self) -> ErrorContext:
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is not None:
-            self.error = exc_val
-            
-            # Log error if logger provided
-            if self.logger:
-                self.logger.error(f"Error in {self.operation}: {exc_val}")
-            
-            # Convert to YouTubeMCPError if needed
-            if not isinstance(exc_val, YouTubeMCPError):
-                wrapped_error = YouTubeMCPError(
-                    message=f"Error in {self.operation}: {exc_val}",
-                    details={"operation": self.operation, "original_error": str(exc_val)},
-                )
-                
-                if self.reraise:
-                    raise wrapped_error from exc_val
-            elif self.reraise:
-                raise exc_val
-            
-            # Don't reraise if reraise=False
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        if exc_type is None:
+            return False
+        
+        self.error = exc_val
+        
+        # Log error if logger provided
+        logger = self.logger
+        if logger is not None:
+            logger.error("Error in %s: %s", self.operation, exc_val)
+        
+        # Our own errors propagate unchanged; returning False lets the
+        # interpreter re-raise them without an extra raise frame
+        if isinstance(exc_val, YouTubeMCPError):
             return not self.reraise
         
-        return False
+        # Convert to YouTubeMCPError if needed
+        if self.reraise:
+            operation = self.operation
+            raise YouTubeMCPError(
+                message=f"Error in {operation}: {exc_val}",
+                details={"operation": operation, "original_error": str(exc_val)},
+            ) from exc_val
+        
+        # Swallow the error if reraise=False
+        return True
 
 
 # Utility functions for error handling
@@ -629,16 +862,21 @@ def is_recoverable_error(error: Exception) -> bool:
     return True
 
 
+# Error classes grouped by severity, checked in order by get_error_severity
+_CRITICAL_ERRORS = (ConfigurationError, AuthenticationError)
+_WARNING_ERRORS = (QuotaExceededError, RateLimitExceededError)
+_INFO_ERRORS = (ValidationError, ResourceNotFoundError)
+
+
 def get_error_severity(error: Exception) -> str:
     """Get error severity level."""
-    if isinstance(error, (ConfigurationError, AuthenticationError)):
+    if isinstance(error, _CRITICAL_ERRORS):
         return "critical"
-    elif isinstance(error, (QuotaExceededError, RateLimitExceededError)):
+    if isinstance(error, _WARNING_ERRORS):
         return "warning"
-    elif isinstance(error, (ValidationError, ResourceNotFoundError)):
+    if isinstance(error, _INFO_ERRORS):
         return "info"
-    else:
-        return "error"
+    return "error"
 
 
 def format_error_for_user(error: Exception) -> Dict[str, Any]:
@@ -657,4 +895,4 @@ def format_error_for_user(error: Exception) -> Dict[str, Any]:
             "message": str(error),
             "code": "UNKNOWN_ERROR",
             "recoverable": True,
-        }
\ No newline at end of file
+        }
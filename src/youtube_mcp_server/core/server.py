@@ -7,6 +7,7 @@ tools, manages resources, handles authentication, and provides the main API inte
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
@@ -22,6 +23,33 @@ from ..tools import YouTubeMCPTools
 
 logger = logging.getLogger(__name__)
 
+# Tool categories by name prefix (the part before the first underscore)
+_PREFIX_TO_CATEGORY = {
+    "search": "data_collection",
+    "get": "data_collection",
+    "collect": "data_collection",
+    "extract": "data_collection",
+    "analyze": "analytics",
+    "detect": "analytics",
+    "predict": "analytics",
+    "perform": "analytics",
+}
+
+# Fallback categories by substring, checked in order
+_KEYWORD_CATEGORIES = (
+    ("dashboard", "visualization"),
+    ("chart", "visualization"),
+    ("plot", "visualization"),
+    ("visualiz", "visualization"),
+    ("wordcloud", "visualization"),
+    ("export", "export"),
+    ("report", "export"),
+    ("generate_comprehensive", "export"),
+    ("thumbnail", "ai_analysis"),
+    ("competitor", "ai_analysis"),
+    ("ai_", "ai_analysis"),
+)
+
 
 class YouTubeMCPServer:
     """
@@ -45,10 +73,17 @@ class YouTubeMCPServer:
         # Core YouTube MCP Tools
         self.youtube_tools: Optional[YouTubeMCPTools] = None
         
+        # Tool info cache, built once from get_tools() (see _get_tool_cache)
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._tool_info_by_name: Dict[str, Dict[str, Any]] = {}
+        self._tools_by_category: Dict[str, List[Dict[str, Any]]] = {}
+        
         # Server state
         self._initialized = False
         self._running = False
         self._startup_time: Optional[datetime] = None
+        # Monotonic clock reading at startup, used for uptime
+        self._startup_monotonic: Optional[float] = None
         
         logger.info("YouTube MCP Server initialized")
     
@@ -69,6 +104,7 @@ class YouTubeMCPServer:
             
             self._initialized = True
             self._startup_time = datetime.now()
+            self._startup_monotonic = time.monotonic()
             
             logger.info("YouTube MCP Server successfully initialized")
             
@@ -84,16 +120,64 @@ class YouTubeMCPServer:
             raise ConfigurationError("YouTube tools not initialized")
         
         # Get all tools from YouTube MCP Tools
+        self.invalidate_tool_cache()
         tools = self.youtube_tools.get_tools()
         
         # Register each tool with the FastMCP server
+        execute_tool = self.youtube_tools.execute_tool
         for tool in tools:
-            @self.mcp.tool(tool.name, description=tool.description, inputSchema=tool.inputSchema)
-            async def tool_handler(name: str = tool.name, **kwargs):
-                return await self.youtube_tools.execute_tool(name, kwargs)
+            register = self.mcp.tool(
+                tool.name, description=tool.description, inputSchema=tool.inputSchema
+            )
+            register(self._make_tool_handler(tool.name, execute_tool))
         
+        self._build_tool_cache(tools)
         logger.info("Registered %d tools", len(tools))
     
+    @staticmethod
+    def _make_tool_handler(tool_name: str, execute_tool):
+        """Create the handler that forwards calls for one tool to execute_tool."""
+        async def handler(**kwargs):
+            return await execute_tool(tool_name, kwargs)
+        
+        handler.__name__ = handler.__qualname__ = f"tool_{tool_name}"
+        return handler
+    
+    def _build_tool_cache(self, tools: List[types.Tool]) -> None:
+        """Build the sorted tool list and the name/category lookups."""
+        tool_infos = sorted(
+            (
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "schema": tool.inputSchema,
+                    "category": self._categorize_tool(tool.name),
+                }
+                for tool in tools
+            ),
+            key=lambda x: x["name"],
+        )
+        
+        by_category: Dict[str, List[Dict[str, Any]]] = {}
+        for tool_info in tool_infos:
+            by_category.setdefault(tool_info["category"], []).append(tool_info)
+        
+        self._tools_cache = tool_infos
+        self._tool_info_by_name = {tool_info["name"]: tool_info for tool_info in tool_infos}
+        self._tools_by_category = by_category
+    
+    def _get_tool_cache(self) -> List[Dict[str, Any]]:
+        """Return the cached tool list, building it if it was invalidated."""
+        if self._tools_cache is None:
+            self._build_tool_cache(self.youtube_tools.get_tools())
+        return self._tools_cache
+    
+    def invalidate_tool_cache(self) -> None:
+        """Drop the cached tool info; call whenever the registered tools change."""
+        self._tools_cache = None
+        self._tool_info_by_name = {}
+        self._tools_by_category = {}
+    
     async def start(self) -> None:
         """Start the MCP server."""
         if self._running:
@@ -145,10 +229,7 @@ class YouTubeMCPServer:
         health_data = {
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
-            "uptime_seconds": (
-                (datetime.now() - self._startup_time).total_seconds()
-                if self._startup_time else 0
-            ),
+            "uptime_seconds": self.uptime,
             "components": {},
         }
         
@@ -191,14 +272,11 @@ class YouTubeMCPServer:
         Returns:
             Server metrics data.
         """
-        tools_count = len(self.youtube_tools.get_tools()) if self.youtube_tools else 0
+        tools_count = len(self._get_tool_cache()) if self.youtube_tools else 0
         
         metrics = {
             "server": {
-                "uptime_seconds": (
-                    (datetime.now() - self._startup_time).total_seconds()
-                    if self._startup_time else 0
-                ),
+                "uptime_seconds": self.uptime,
                 "initialized": self._initialized,
                 "running": self._running,
             },
@@ -228,17 +306,10 @@ class YouTubeMCPServer:
         if not self.youtube_tools:
             return None
         
-        tools = self.youtube_tools.get_tools()
-        for tool in tools:
-            if tool.name == tool_name:
-                return {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "schema": tool.inputSchema,
-                    "category": self._categorize_tool(tool.name),
-                }
-        
-        return None
+        self._get_tool_cache()
+        tool_info = self._tool_info_by_name.get(tool_name)
+        # Copy so callers can't modify the cached entry
+        return dict(tool_info) if tool_info is not None else None
     
     def list_tools(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -253,34 +324,25 @@ class YouTubeMCPServer:
         if not self.youtube_tools:
             return []
         
-        tools = []
-        for tool in self.youtube_tools.get_tools():
-            tool_info = {
-                "name": tool.name,
-                "description": tool.description,
-                "schema": tool.inputSchema,
-                "category": self._categorize_tool(tool.name),
-            }
-            
-            if not category or tool_info["category"] == category:
-                tools.append(tool_info)
+        tools = self._get_tool_cache()
+        if category:
+            tools = self._tools_by_category.get(category, [])
         
-        return sorted(tools, key=lambda x: x["name"])
+        # Copy the list and each entry so callers can't modify the cache
+        return [dict(tool_info) for tool_info in tools]
     
     def _categorize_tool(self, tool_name: str) -> str:
         """Categorize a tool based on its name."""
-        if any(tool_name.startswith(prefix) for prefix in ["search_", "get_", "collect_", "extract_"]):
-            return "data_collection"
-        elif any(tool_name.startswith(prefix) for prefix in ["analyze_", "detect_", "predict_", "perform_"]):
-            return "analytics"
-        elif any(word in tool_name for word in ["dashboard", "chart", "plot", "visualiz", "wordcloud"]):
-            return "visualization"
-        elif any(word in tool_name for word in ["export", "report", "generate_comprehensive"]):
-            return "export"
-        elif any(word in tool_name for word in ["thumbnail", "competitor", "ai_"]):
-            return "ai_analysis"
-        else:
-            return "other"
+        prefix, sep, _ = tool_name.partition("_")
+        if sep:
+            category = _PREFIX_TO_CATEGORY.get(prefix)
+            if category is not None:
+                return category
+        
+        for keyword, category in _KEYWORD_CATEGORIES:
+            if keyword in tool_name:
+                return category
+        return "other"
     
     @property
     def is_initialized(self) -> bool:
@@ -295,9 +357,9 @@ class YouTubeMCPServer:
     @property
     def uptime(self) -> float:
         """Get server uptime in seconds."""
-        if not self._startup_time:
+        if self._startup_monotonic is None:
             return 0.0
-        return (datetime.now() - self._startup_time).total_seconds()
+        return time.monotonic() - self._startup_monotonic
 
 
 # Context manager support
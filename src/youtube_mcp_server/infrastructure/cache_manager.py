@@ -7,86 +7,249 @@ Adapted from existing cache_manager.py with async support and MCP-specific enhan
 import json
 import os
 import random
+import re
 import asyncio
-from typing import Dict, Any, Optional
+import sqlite3
+from collections import Counter, OrderedDict
+from typing import Dict, Any, Mapping, Optional, Callable, Awaitable, Tuple
 import time
 from pathlib import Path
+from types import MappingProxyType
 import threading
 import logging
 from contextlib import asynccontextmanager
 
+from ..core.exceptions import NetworkError, QuotaExceededError, RateLimitExceededError
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Layout version of cache.db, stored in PRAGMA user_version. Bump it when the
+# kv table or value encoding changes; older databases are then discarded.
+_SCHEMA_VERSION = 1
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize cache data to JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str).encode('utf-8')
+
+
+def _loads(value: bytes) -> Any:
+    """Deserialize JSON bytes written by _dumps."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+# Error classes used to tune retries and logging, checked by exception type
+# first and by message keywords otherwise
+_ERROR_CLASS_BY_TYPE: Dict[type, str] = {
+    QuotaExceededError: "quota",
+    RateLimitExceededError: "rate",
+    NetworkError: "network",
+    ConnectionError: "network",
+}
+
+# Lookaheads keep the priority quota > rate > network wherever the keyword
+# appears in the message
+_ERROR_CLASS_RE = re.compile(
+    r"(?=.*quota)(?P<quota>)"
+    r"|(?=.*(?:rate|limit|throttle))(?P<rate>)"
+    r"|(?=.*(?:network|connection))(?P<network>)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_RETRY_MULTIPLIERS = {"quota": 4, "rate": 3}
+
+_ERROR_CLASS_WARNINGS = {
+    "quota": "YouTube API quota may be exhausted",
+    "rate": "Rate limiting detected",
+    "network": "Network connectivity issue detected",
+}
+
+
+# Error types ErrorHandler marks as worth retrying
+_RETRY_ERROR_TYPES = frozenset(("ConnectionError", "TimeoutError", "HTTPError"))
+
+# (second, formatted date and time) of the last error response timestamp
+_UTC_ISO_CACHE: Tuple[int, str] = (-1, "")
+
+
+def _utc_isoformat() -> str:
+    """Return the current UTC time like datetime.utcnow().isoformat().
+    
+    The formatted date and time are reused within the same second; only the
+    microseconds are formatted per call.
+    """
+    global _UTC_ISO_CACHE
+    
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, iso = _UTC_ISO_CACHE
+    if cached_sec != sec:
+        iso = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _UTC_ISO_CACHE = (sec, iso)
+    us = ns // 1000
+    return f"{iso}.{us:06d}" if us else iso
+
+
+def _classify_error(error: BaseException, message: Optional[str] = None) -> Optional[str]:
+    """Return "quota", "rate", "network" or None for an exception."""
+    for cls in type(error).__mro__:
+        error_class = _ERROR_CLASS_BY_TYPE.get(cls)
+        if error_class is not None:
+            return error_class
+    match = _ERROR_CLASS_RE.match(str(error) if message is None else message)
+    return match.lastgroup if match else None
+
 
 class CacheManager:
     """
     Manages caching of YouTube data with TTL and async support.
     
-    Adapted from existing cache_manager.py with async enhancements.
+    Adapted from existing cache_manager.py with async enhancements. Entries are
+    persisted in a single SQLite database (cache.db, WAL journal) in cache_dir.
     """
     
-    def __init__(self, cache_dir: str = "cache", ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        cache_dir: str = "cache",
+        ttl_seconds: int = 3600,
+        max_items: int = 10000,
+        flush_interval: float = 0.1
+    ):
         """
         Initialize cache manager.
         
         Args:
             cache_dir: Directory to store cache files
             ttl_seconds: Time-to-live in seconds for cached items
+            max_items: Maximum number of items; least recently used are evicted
+            flush_interval: Seconds to collect changes before writing them to disk
         """
         self.cache_dir = Path(cache_dir)
         self.ttl_seconds = ttl_seconds
+        self.max_items = max_items
+        self.flush_interval = flush_interval
         self.cache: Dict[str, Dict[str, Any]] = {}
-        self.access_times: Dict[str, float] = {}
+        # Ordered from least to most recently used, so expired and evicted
+        # entries are always at the front
+        self.access_times: "OrderedDict[str, float]" = OrderedDict()
         self.lock = asyncio.Lock()
         
+        # Serialized size of each entry, kept so get_stats() doesn't have to
+        # re-serialize the whole cache
+        self._entry_sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        
+        # Loads in progress in get_or_set, so concurrent misses share one fetch
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # Disk changes waiting for the next flush: key -> (timestamp, ttl, data),
+        # or None to delete the entry
+        self._pending_writes: Dict[str, Optional[Tuple[float, int, Any]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # Set by aclose(); later changes stay in memory only
+        self._closed = False
+        
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
+        # Open the cache database. Executor threads use the connection, but
+        # only one at a time since every disk operation runs under self.lock.
+        # Memory is updated immediately; disk changes are written in batches.
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / "cache.db"),
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_schema()
+        
         # Load existing cache
         self._load_cache_sync()
     
+    def _ensure_schema(self) -> None:
+        """Create the kv table, replacing it if written by another schema version.
+        
+        Rows are only ever written by this class, so once the version matches
+        loading trusts them without per-row validation.
+        """
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != _SCHEMA_VERSION:
+            # A new database: delete the JSON files of the old per-key cache once
+            if version == 0:
+                self._remove_legacy_files()
+            self._conn.execute("DROP TABLE IF EXISTS kv")
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv "
+            "(k TEXT PRIMARY KEY, ts REAL NOT NULL, ttl INTEGER NOT NULL, v BLOB NOT NULL)"
+        )
+    
+    def _remove_legacy_files(self) -> None:
+        """Delete the per-key *.json files written before cache.db existed (synchronous)."""
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                cache_file.unlink()
+            except OSError as e:
+                logger.error("Error removing legacy cache file %s: %s", cache_file, e)
+    
     def _load_cache_sync(self) -> None:
-        """Load cached data from disk (synchronous)."""
+        """Load unexpired cached data from disk, dropping expired rows (synchronous)."""
+        cutoff = time.time() - self.ttl_seconds
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                try:
-                    with open(cache_file) as f:
-                        data = json.load(f)
-                        if self._is_valid_cache_data(data):
-                            cache_key = cache_file.stem
-                            self.cache[cache_key] = data['data']
-                            self.access_times[cache_key] = data['timestamp']
-                except Exception as e:
-                    logger.error(f"Error loading cache file {cache_file}: {e}")
-        except Exception as e:
-            logger.error(f"Error loading cache directory: {e}")
-    
-    def _is_valid_cache_data(self, data: Dict[str, Any]) -> bool:
-        """Check if cached data is valid and not expired."""
-        return (isinstance(data, dict) and 
-                'timestamp' in data and 
-                'data' in data and 
-                time.time() - data['timestamp'] <= self.ttl_seconds)
+            self._conn.execute("DELETE FROM kv WHERE ts < ?", (cutoff,))
+            rows = self._conn.execute(
+                "SELECT k, ts, v FROM kv ORDER BY ts DESC LIMIT ?",
+                (self.max_items,),
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error("Error loading cache database: %s", e)
+            return
+        
+        # Oldest first, to keep access_times in recency order
+        for cache_key, timestamp, value in reversed(rows):
+            try:
+                self.cache[cache_key] = _loads(value)
+                self.access_times[cache_key] = timestamp
+                self._track_size(cache_key, len(value))
+            except Exception as e:
+                logger.error("Error loading cache entry %s: %s", cache_key, e)
     
     async def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """
         Get data from cache if available and not expired.
         
+        Only in-memory state is touched, so no lock is needed.
+        
         Args:
             cache_key: Cache key
             
         Returns:
             Cached data or None if not found/expired
         """
-        async with self.lock:
-            if cache_key in self.cache:
-                if time.time() - self.access_times[cache_key] <= self.ttl_seconds:
-                    self.access_times[cache_key] = time.time()  # Update access time
-                    return self.cache[cache_key]
-                else:
-                    # Remove expired data
-                    await self._remove_expired_item(cache_key)
+        access_times = self.access_times
+        access_time = access_times.get(cache_key)
+        if access_time is None:
             return None
+        
+        now = time.time()
+        if now - access_time <= self.ttl_seconds:
+            access_times[cache_key] = now  # Update access time
+            access_times.move_to_end(cache_key)
+            return self.cache[cache_key]
+        
+        # Remove expired data
+        await self._remove_expired_item(cache_key)
+        return None
     
     async def set(self, cache_key: str, data: Any, ttl: Optional[int] = None) -> None:
         """
@@ -97,67 +260,224 @@ class CacheManager:
             data: Data to cache
             ttl: Override TTL for this item
         """
-        async with self.lock:
-            now = time.time()
-            
-            # Store in memory
-            self.cache[cache_key] = data
-            self.access_times[cache_key] = now
+        now = time.time()
+        
+        # Store in memory
+        self.cache[cache_key] = data
+        self.access_times[cache_key] = now
+        self.access_times.move_to_end(cache_key)
+        
+        # Evict least recently used items beyond max_items
+        while len(self.access_times) > self.max_items:
+            evicted_key, _ = self.access_times.popitem(last=False)
+            self._forget(evicted_key)
+            self._queue_write(evicted_key, None)
+        
+        # Store on disk with the next flush
+        self._queue_write(cache_key, (now, ttl or self.ttl_seconds, data))
+    
+    async def get_or_set(
+        self,
+        cache_key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None
+    ) -> Any:
+        """
+        Get data from cache, loading and storing it on a miss.
+        
+        Concurrent misses for the same key wait for the first caller's load
+        instead of each calling the loader.
+        
+        Args:
+            cache_key: Cache key
+            loader: Coroutine function producing the data; a None result is
+                returned but not cached
+            ttl: Override TTL for this item
             
-            # Store on disk
-            cache_file = self.cache_dir / f"{cache_key}.json"
-            cache_data = {
-                'timestamp': now,
-                'data': data,
-                'ttl': ttl or self.ttl_seconds
-            }
+        Returns:
+            Cached or freshly loaded data
+        """
+        cached = await self.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        future = self._inflight.get(cache_key)
+        if future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The caller doing the load was cancelled; load it ourselves
+                return await self.get_or_set(cache_key, loader, ttl)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            data = await loader()
+            if data is not None:
+                await self.set(cache_key, data, ttl)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited future doesn't log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            del self._inflight[cache_key]
+    
+    def _queue_write(self, cache_key: str, entry: Optional[Tuple[float, int, Any]]) -> None:
+        """Queue a disk write (or delete, for None) and schedule a flush."""
+        if self._closed:
+            return
+        self._pending_writes[cache_key] = entry
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._delayed_flush())
+    
+    async def _delayed_flush(self) -> None:
+        """Flush queued changes once flush_interval has passed."""
+        await asyncio.sleep(self.flush_interval)
+        self._flush_task = None
+        await self.flush()
+    
+    async def flush(self) -> None:
+        """Write all queued changes to disk now."""
+        async with self.lock:
+            if self._closed:
+                self._pending_writes.clear()
+                return
+            if not self._pending_writes:
+                return
+            batch = self._pending_writes
+            self._pending_writes = {}
             
-            # Write to file asynchronously
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._write_cache_file, cache_file, cache_data)
+            loop = asyncio.get_running_loop()
+            sizes = await loop.run_in_executor(None, self._write_cache_entries, batch)
+        
+        for cache_key, size in sizes.items():
+            if cache_key in self.cache:
+                self._track_size(cache_key, size)
+    
+    def _write_cache_entries(
+        self,
+        batch: Dict[str, Optional[Tuple[float, int, Any]]]
+    ) -> Dict[str, int]:
+        """Apply queued changes to the database in one transaction (synchronous).
+        
+        Returns:
+            Serialized size in bytes of each entry written
+        """
+        sizes: Dict[str, int] = {}
+        deletes = []
+        rows = []
+        for cache_key, entry in batch.items():
+            if entry is None:
+                deletes.append((cache_key,))
+                continue
+            timestamp, ttl, data = entry
+            try:
+                value = _dumps(data)
+            except Exception as e:
+                logger.error("Error serializing cache entry %s: %s", cache_key, e)
+                continue
+            rows.append((cache_key, timestamp, ttl, value))
+            sizes[cache_key] = len(value)
+        
+        try:
+            self._conn.execute("BEGIN")
+            if deletes:
+                self._conn.executemany("DELETE FROM kv WHERE k = ?", deletes)
+            if rows:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO kv (k, ts, ttl, v) VALUES (?, ?, ?, ?)", rows
+                )
+            self._conn.execute("COMMIT")
+        except sqlite3.Error:
+            logger.exception("Error writing cache entries")
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            return {}
+        return sizes
+    
+    def _track_size(self, cache_key: str, size: int) -> None:
+        """Record the serialized size of an entry (0 to forget it)."""
+        self._total_bytes += size - self._entry_sizes.pop(cache_key, 0)
+        if size:
+            self._entry_sizes[cache_key] = size
     
-    def _write_cache_file(self, cache_file: Path, cache_data: Dict[str, Any]) -> None:
-        """Write cache data to file (synchronous)."""
+    def _delete_all_entries(self) -> None:
+        """Delete every stored entry and shrink the WAL file (synchronous)."""
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, default=str)
-        except Exception as e:
-            logger.error(f"Error writing cache file {cache_file}: {e}")
+            self._conn.execute("DELETE FROM kv")
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            logger.error("Error deleting cache entries: %s", e)
+    
+    def _forget(self, cache_key: str) -> None:
+        """Drop an item's in-memory data (its access time is removed by the caller)."""
+        self.cache.pop(cache_key, None)
+        self._track_size(cache_key, 0)
     
     async def _remove_expired_item(self, cache_key: str) -> None:
         """Remove expired item from cache."""
-        if cache_key in self.cache:
-            del self.cache[cache_key]
-        if cache_key in self.access_times:
-            del self.access_times[cache_key]
-        
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        if cache_file.exists():
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, cache_file.unlink)
+        self.access_times.pop(cache_key, None)
+        self._forget(cache_key)
+        self._queue_write(cache_key, None)
     
     async def clear_expired(self) -> None:
-        """Remove expired items from cache."""
-        async with self.lock:
-            now = time.time()
-            expired = [
-                key for key, access_time in self.access_times.items()
-                if now - access_time > self.ttl_seconds
-            ]
-            
-            for cache_key in expired:
-                await self._remove_expired_item(cache_key)
+        """Remove expired items from cache and flush pending disk changes."""
+        # access_times is in recency order, so stop at the first live item
+        cutoff = time.time() - self.ttl_seconds
+        access_times = self.access_times
+        while access_times:
+            cache_key = next(iter(access_times))
+            if access_times[cache_key] >= cutoff:
+                break
+            del access_times[cache_key]
+            self._forget(cache_key)
+            self._pending_writes[cache_key] = None
+        
+        await self.flush()
     
     async def clear_all(self) -> None:
         """Clear all cached data."""
+        self.cache.clear()
+        self.access_times.clear()
+        self._entry_sizes.clear()
+        self._total_bytes = 0
+        self._pending_writes.clear()
+        
+        # Nothing is left to write, so drop the scheduled flush
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        
+        # Remove stored entries in a single executor call
         async with self.lock:
-            self.cache.clear()
-            self.access_times.clear()
-            
-            # Remove files asynchronously
-            loop = asyncio.get_event_loop()
-            for cache_file in self.cache_dir.glob("*.json"):
-                await loop.run_in_executor(None, cache_file.unlink)
+            if self._closed:
+                return
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._delete_all_entries)
+    
+    async def aclose(self) -> None:
+        """Write pending changes to disk and close the database.
+        
+        The in-memory cache keeps working afterwards, but changes are no
+        longer written to disk.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+        async with self.lock:
+            self._closed = True
+            self._pending_writes.clear()
+            self._conn.close()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -165,15 +485,13 @@ class CacheManager:
             'total_items': len(self.cache),
             'cache_dir': str(self.cache_dir),
             'ttl_seconds': self.ttl_seconds,
+            'max_items': self.max_items,
             'memory_usage_mb': self._estimate_memory_usage() / (1024 * 1024)
         }
     
     def _estimate_memory_usage(self) -> int:
-        """Estimate memory usage in bytes."""
-        try:
-            return len(json.dumps(self.cache, default=str).encode('utf-8'))
-        except Exception:
-            return 0
+        """Estimate memory usage in bytes from the serialized entry sizes."""
+        return self._total_bytes
 
 
 class RateLimiter:
@@ -201,38 +519,46 @@ class RateLimiter:
         """
         Acquire tokens, waiting if necessary.
         
+        Tokens are reserved under the lock and the wait happens outside it,
+        so the balance can go negative. Each waiter sleeps until its own
+        reservation is paid off, which keeps callers in FIFO order and lets
+        them proceed at the configured rate instead of one at a time.
+        
         Args:
             tokens: Number of tokens to acquire
         """
         async with self.lock:
-            await self._wait_for_tokens(tokens)
+            self._refill()
             self.tokens -= tokens
-    
-    async def _wait_for_tokens(self, tokens: int) -> None:
-        """Wait for tokens to be available."""
-        while True:
-            now = time.time()
-            time_passed = now - self.last_update
-            self.tokens = min(
-                self.bucket_size,
-                self.tokens + time_passed * self.tokens_per_second
-            )
-            self.last_update = now
-            
-            if self.tokens >= tokens:
-                break
-            
-            wait_time = (tokens - self.tokens) / self.tokens_per_second
+            if self.tokens >= 0:
+                return
+            wait_time = -self.tokens / self.tokens_per_second
+        
+        try:
             await asyncio.sleep(wait_time)
+        except asyncio.CancelledError:
+            # Give back the reservation so later callers don't wait for it
+            self.tokens += tokens
+            raise
+    
+    def _refill(self) -> None:
+        """Add tokens earned since the last update."""
+        now = time.time()
+        time_passed = now - self.last_update
+        self.tokens = min(
+            self.bucket_size,
+            self.tokens + time_passed * self.tokens_per_second
+        )
+        self.last_update = now
     
     def get_tokens_available(self) -> float:
         """Get current number of tokens available."""
         now = time.time()
         time_passed = now - self.last_update
-        return min(
+        return max(0.0, min(
             self.bucket_size,
             self.tokens + time_passed * self.tokens_per_second
-        )
+        ))
     
     def get_stats(self) -> Dict[str, Any]:
         """Get rate limiter statistics."""
@@ -292,19 +618,19 @@ class RetryManager:
                     return await func(*args, **kwargs)
                 else:
                     # Run sync function in executor
-                    loop = asyncio.get_event_loop()
+                    loop = asyncio.get_running_loop()
                     return await loop.run_in_executor(None, func, *args, **kwargs)
                     
             except Exception as e:
                 last_exception = e
-                logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                logger.warning("Attempt %d failed: %s", attempt + 1, e)
                 
                 if attempt < self.max_retries:
                     delay = self.calculate_delay(attempt, e)
-                    logger.info(f"Retrying in {delay:.2f} seconds...")
+                    logger.info("Retrying in %.2f seconds...", delay)
                     await asyncio.sleep(delay)
                 else:
-                    logger.error(f"All {self.max_retries + 1} attempts failed")
+                    logger.error("All %d attempts failed", self.max_retries + 1)
                     break
         
         if last_exception:
@@ -321,20 +647,10 @@ class RetryManager:
         Returns:
             Delay in seconds
         """
-        # Adjust delay based on error type
+        # Longer delay for quota errors, medium for rate limiting
+        multiplier = self.exponential_base
         if error is not None:
-            if isinstance(error, Exception) and "quota" in str(error).lower():
-                # Longer delay for quota errors
-                multiplier = 4
-            elif isinstance(error, Exception) and any(term in str(error).lower() 
-                                                     for term in ["rate", "limit", "throttle"]):
-                # Medium delay for rate limiting
-                multiplier = 3
-            else:
-                # Standard delay for other errors
-                multiplier = self.exponential_base
-        else:
-            multiplier = self.exponential_base
+            multiplier = _RETRY_MULTIPLIERS.get(_classify_error(error), multiplier)
 
         delay = min(
             self.max_delay,
@@ -345,7 +661,8 @@ class RetryManager:
         jitter_amount = delay * self.jitter
         final_delay = delay + (random.random() * 2 - 1) * jitter_amount
         
-        logger.debug(f"Calculated retry delay: {final_delay:.2f}s for attempt {attempt}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calculated retry delay: %.2fs for attempt %d", final_delay, attempt)
         return max(0, final_delay)  # Ensure non-negative delay
     
     def get_stats(self) -> Dict[str, Any]:
@@ -364,16 +681,20 @@ class ErrorHandler:
     Centralized error handling for the MCP server.
     """
     
-    def __init__(self, logger_name: str = __name__):
+    def __init__(self, logger_name: str = __name__, max_last_errors: int = 128):
         """
         Initialize error handler.
         
         Args:
             logger_name: Name for the logger
+            max_last_errors: Number of error types whose last message is kept
         """
         self.logger = logging.getLogger(logger_name)
-        self.error_counts: Dict[str, int] = {}
-        self.last_errors: Dict[str, str] = {}
+        self.max_last_errors = max_last_errors
+        self.error_counts: Counter = Counter()
+        # Ordered from least to most recently seen error type
+        self.last_errors: OrderedDict = OrderedDict()
+        self._total_errors = 0
     
     def handle_error(self, error: Exception, context: str = "unknown") -> Dict[str, Any]:
         """
@@ -390,43 +711,49 @@ class ErrorHandler:
         error_message = str(error)
         
         # Update statistics
-        self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
-        self.last_errors[error_type] = error_message
+        self.error_counts[error_type] += 1
+        self._total_errors += 1
+        last_errors = self.last_errors
+        last_errors[error_type] = error_message
+        last_errors.move_to_end(error_type)
+        if len(last_errors) > self.max_last_errors:
+            last_errors.popitem(last=False)
         
         # Log the error
-        self.logger.error(f"Error in {context}: {error_type}: {error_message}")
+        self.logger.error("Error in %s: %s: %s", context, error_type, error_message)
         
         # Log additional details for specific error types
-        if "quota" in error_message.lower():
-            self.logger.warning("YouTube API quota may be exhausted")
-        elif "rate" in error_message.lower() or "limit" in error_message.lower():
-            self.logger.warning("Rate limiting detected")
-        elif "network" in error_message.lower() or "connection" in error_message.lower():
-            self.logger.warning("Network connectivity issue detected")
+        error_class = _classify_error(error, error_message)
+        if error_class is not None:
+            self.logger.warning(_ERROR_CLASS_WARNINGS[error_class])
         
         # Return standardized error response
-        from datetime import datetime
         return {
             "success": False,
             "error": error_message,
             "error_type": error_type,
             "context": context,
-            "timestamp": datetime.utcnow().isoformat(),
-            "retry_suggested": error_type in ["ConnectionError", "TimeoutError", "HTTPError"]
+            "timestamp": _utc_isoformat(),
+            "retry_suggested": error_type in _RETRY_ERROR_TYPES
         }
     
     def get_error_stats(self) -> Dict[str, Any]:
         """Get error statistics."""
         return {
-            'error_counts': self.error_counts.copy(),
-            'last_errors': self.last_errors.copy(),
-            'total_errors': sum(self.error_counts.values())
+            'error_counts': dict(self.error_counts),
+            'last_errors': dict(self.last_errors),
+            'total_errors': self._total_errors
         }
     
+    def get_error_counts_view(self) -> Mapping[str, int]:
+        """Get a read-only live view of the error counts, without copying."""
+        return MappingProxyType(self.error_counts)
+    
     def reset_stats(self) -> None:
         """Reset error statistics."""
         self.error_counts.clear()
         self.last_errors.clear()
+        self._total_errors = 0
 
 
 # Async context managers for resource management
@@ -437,7 +764,7 @@ async def managed_cache(cache_dir: str = "cache", ttl_seconds: int = 3600):
     try:
         yield cache
     finally:
-        await cache.clear_expired()
+        await cache.aclose()
 
 
 @asynccontextmanager
@@ -3,20 +3,71 @@ Resource Manager for YouTube MCP Server.
 Manages persistent storage of search results, analysis sessions, and generated content.
 """
 
+import errno
 import json
 import logging
+import os
+import re
 import shutil
+import time
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 import hashlib
+import itertools
+import secrets
 import asyncio
+import base64
+import mmap
+from collections import OrderedDict
+from contextlib import contextmanager
 
 from mcp.types import Resource, TextResourceContents, BlobResourceContents
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when installed.
+    
+    Data orjson rejects, such as numpy.float64 and other float subclasses,
+    is serialized by the json module instead.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON written by _dumps."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Resource URIs: youtube://<type>/<id>
+_URI_RE = re.compile(r"youtube://(search|details|visualization|session)/([^/]+)")
+
+# fdatasync skips flushing file metadata where the platform supports it
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# copy_file_range errors meaning it won't work between these filesystems
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset(
+    (errno.EXDEV, errno.ENOSYS, errno.ENOTSUP, errno.EOPNOTSUPP)
+)
+
 
 class AnalysisSession:
     """Represents an analysis session with associated resources."""
@@ -27,33 +78,58 @@ class AnalysisSession:
         self.description = description
         self.created_at = datetime.utcnow()
         self.updated_at = datetime.utcnow()
-        self.video_ids: Set[str] = set()
+        # Insertion-ordered set of video IDs (values are unused)
+        self.video_ids: Dict[str, None] = {}
         self.search_queries: List[str] = []
         self.resources: List[str] = []  # Resource URIs
         self.metadata: Dict[str, Any] = {}
+        # Membership indexes for the two lists above, kept in sync by add_*
+        self._search_query_set: Set[str] = set()
+        self._resource_set: Set[str] = set()
+        # Result of to_dict(), cleared whenever the session changes
+        self._dict_cache: Optional[Dict[str, Any]] = None
     
-    def add_video_ids(self, video_ids: Union[str, List[str]]) -> None:
-        """Add video IDs to the session."""
+    def add_video_ids(self, video_ids: Union[str, List[str]],
+                      now: Optional[datetime] = None) -> None:
+        """Add video IDs to the session.
+        
+        ``now`` lets callers making several updates share one timestamp.
+        """
         if isinstance(video_ids, str):
             video_ids = [video_ids]
-        self.video_ids.update(video_ids)
-        self.updated_at = datetime.utcnow()
+        self.video_ids.update(dict.fromkeys(video_ids))
+        self.updated_at = now or datetime.utcnow()
+        self._dict_cache = None
     
-    def add_search_query(self, query: str) -> None:
+    def add_search_query(self, query: str, now: Optional[datetime] = None) -> None:
         """Add a search query to the session."""
-        if query not in self.search_queries:
+        if query not in self._search_query_set:
+            self._search_query_set.add(query)
             self.search_queries.append(query)
-            self.updated_at = datetime.utcnow()
+            self.updated_at = now or datetime.utcnow()
+            self._dict_cache = None
     
-    def add_resource(self, resource_uri: str) -> None:
+    def add_resource(self, resource_uri: str, now: Optional[datetime] = None) -> None:
         """Add a resource URI to the session."""
-        if resource_uri not in self.resources:
+        if resource_uri not in self._resource_set:
+            self._resource_set.add(resource_uri)
             self.resources.append(resource_uri)
-            self.updated_at = datetime.utcnow()
+            self.updated_at = now or datetime.utcnow()
+            self._dict_cache = None
+    
+    def invalidate(self) -> None:
+        """Drop the cached to_dict() result after changing attributes directly."""
+        self._dict_cache = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert session to dictionary."""
-        return {
+        """Convert session to dictionary.
+        
+        The result is cached until the session is changed through add_* or
+        invalidate(), and must not be modified by the caller.
+        """
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "session_id": self.session_id,
             "title": self.title,
             "description": self.description,
@@ -64,6 +140,7 @@ class AnalysisSession:
             "resources": self.resources,
             "metadata": self.metadata
         }
+        return self._dict_cache
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AnalysisSession":
@@ -75,21 +152,43 @@ class AnalysisSession:
         )
         session.created_at = datetime.fromisoformat(data["created_at"])
         session.updated_at = datetime.fromisoformat(data["updated_at"])
-        session.video_ids = set(data.get("video_ids", []))
+        session.video_ids = dict.fromkeys(data.get("video_ids", []))
         session.search_queries = data.get("search_queries", [])
         session.resources = data.get("resources", [])
+        session._search_query_set = set(session.search_queries)
+        session._resource_set = set(session.resources)
         session.metadata = data.get("metadata", {})
         return session
 
 
 class ResourceManager:
-    """Manages MCP resources for YouTube analytics sessions."""
+    """Manages MCP resources for YouTube analytics sessions.
+    
+    Sessions are persisted as a snapshot (sessions/sessions.json) plus an
+    append-only log of changes (sessions/sessions.log). Each change appends
+    one JSON line to the log; the snapshot is rewritten and the log truncated
+    by compact(), which runs every ``compact_every`` logged changes, after
+    loading a non-empty log, and on close(). Until then sessions.json alone
+    can be behind the in-memory state.
+    
+    Every log line carries "op" and "current_session_id":
     
-    def __init__(self, base_path: Union[str, Path]):
+    - ``create``: "session" holds the full session dict
+    - ``update``: "session_id" and "updated_at", plus the "video_ids",
+      "search_queries" and "resources" added since the session was last
+      logged (each omitted when empty)
+    - ``delete``: "session_id" of the removed session
+    - ``switch``: only the current session changed
+    """
+    
+    def __init__(self, base_path: Union[str, Path], compact_every: int = 100,
+                 cache_size: int = 256):
         """Initialize resource manager.
         
         Args:
             base_path: Base directory for storing resources
+            compact_every: Number of logged session changes between compactions
+            cache_size: Number of resources and parsed JSON files kept in memory
         """
         self.base_path = Path(base_path)
         self.sessions_path = self.base_path / "sessions"
@@ -97,26 +196,86 @@ class ResourceManager:
         self.visualizations_path = self.base_path / "visualizations"
         self.cache_path = self.base_path / "cache"
         
+        # Unique IDs for saved searches and visualizations: a random prefix
+        # per manager plus a counter
+        self._id_prefix = secrets.token_hex(3)
+        self._id_counter = itertools.count()
+        
+        # Directories known to exist, so repeated saves skip mkdir
+        self._known_dirs: Set[Path] = set()
+        
         # Create directory structure
         for path in [self.sessions_path, self.searches_path, self.visualizations_path, self.cache_path]:
-            path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(path)
         
         # Session management
         self.sessions: Dict[str, AnalysisSession] = {}
         self.current_session_id: Optional[str] = None
         
+        # Session change log, opened on first write
+        self.compact_every = compact_every
+        self._session_log_path = self.sessions_path / "sessions.log"
+        self._session_log = None
+        self._logged_ops = 0
+        # Session ID -> lengths of (video_ids, search_queries, resources)
+        # already on disk, so "update" records only carry what was added
+        self._logged_sizes: Dict[str, Tuple[int, int, int]] = {}
+        
+        # Changes deferred by batch(): session ID -> op, plus whether the
+        # current session was switched
+        self._batch_depth = 0
+        self._pending_changes: Dict[str, str] = {}
+        self._pending_switch = False
+        
+        # LRU caches: resource URI -> Resource, and file path -> ((mtime_ns, size), data)
+        self.cache_size = cache_size
+        self._resource_cache: "OrderedDict[str, Resource]" = OrderedDict()
+        self._json_cache: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+        
+        # Locations of details files and visualization directories by ID,
+        # filled on save and on first lookup
+        self._details_index: Dict[str, Path] = {}
+        self._viz_index: Dict[str, Path] = {}
+        
+        # Loaders and readers by resource type, as matched by _URI_RE
+        self._resource_loaders = {
+            "search": self._load_search_resource,
+            "details": self._load_details_resource,
+            "visualization": self._load_visualization_resource,
+            "session": self._load_session_resource,
+        }
+        self._resource_readers = {
+            "search": self._read_search_contents,
+            "details": self._read_details_contents,
+            "visualization": self._read_visualization_contents,
+            "session": self._read_session_contents,
+        }
+        
+        # Whether _copy_file tries os.copy_file_range before shutil.copy2
+        self._use_copy_file_range = hasattr(os, "copy_file_range")
+        
         # Load existing sessions
         self._load_sessions()
         
         logger.info(f"Resource manager initialized at {self.base_path}")
     
+    def _new_id(self, kind: str) -> str:
+        """Return a new unique resource ID such as "search_3fa2c1000004"."""
+        return f"{kind}_{self._id_prefix}{next(self._id_counter):06x}"
+    
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory (and parents) unless already known to exist."""
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
+    
     def _load_sessions(self) -> None:
         """Load existing sessions from disk."""
         sessions_file = self.sessions_path / "sessions.json"
         if sessions_file.exists():
             try:
-                with open(sessions_file, 'r') as f:
-                    sessions_data = json.load(f)
+                with open(sessions_file, 'rb') as f:
+                    sessions_data = _loads(f.read())
                 
                 for session_data in sessions_data.get("sessions", []):
                     session = AnalysisSession.from_dict(session_data)
@@ -127,21 +286,254 @@ class ResourceManager:
                 
             except Exception as e:
                 logger.error(f"Failed to load sessions: {e}")
+        
+        self._replay_session_log()
+        for session in self.sessions.values():
+            self._mark_logged(session)
+        # Compact any non-empty log, even one holding only a torn line, so
+        # the next record isn't appended to partial bytes
+        try:
+            log_size = self._session_log_path.stat().st_size
+        except OSError:
+            log_size = 0
+        if log_size:
+            self.compact()
     
-    def _save_sessions(self) -> None:
-        """Save sessions to disk."""
+    def _replay_session_log(self) -> int:
+        """Apply logged session changes on top of the snapshot.
+        
+        Returns:
+            Number of changes applied
+        """
+        if not self._session_log_path.exists():
+            return 0
+        
+        applied = 0
+        try:
+            with open(self._session_log_path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        # A crash can leave a partial last line
+                        logger.warning("Skipping unreadable session log entry")
+                        continue
+                    
+                    try:
+                        self._apply_session_record(record)
+                    except (KeyError, TypeError, ValueError, AttributeError) as e:
+                        logger.warning(f"Skipping malformed session log entry: {e!r}")
+                        continue
+                    applied += 1
+        except Exception as e:
+            logger.error(f"Failed to replay session log: {e}")
+        
+        if applied:
+            logger.info(f"Replayed {applied} session changes")
+        return applied
+    
+    def _apply_session_record(self, record: Dict[str, Any]) -> None:
+        """Apply one logged session change."""
+        op = record.get("op")
+        if op == "create":
+            session = AnalysisSession.from_dict(record["session"])
+            self.sessions[session.session_id] = session
+        elif op == "update":
+            session = self.sessions.get(record["session_id"])
+            if session is not None:
+                self._apply_session_update(session, record)
+        elif op == "delete":
+            self.sessions.pop(record["session_id"], None)
+        self.current_session_id = record.get("current_session_id")
+    
+    @staticmethod
+    def _apply_session_update(session: AnalysisSession, record: Dict[str, Any]) -> None:
+        """Apply a logged "update" record to a session."""
+        session.add_video_ids(record.get("video_ids", []))
+        for query in record.get("search_queries", ()):
+            session.add_search_query(query)
+        for resource_uri in record.get("resources", ()):
+            session.add_resource(resource_uri)
+        session.updated_at = datetime.fromisoformat(record["updated_at"])
+        session.invalidate()
+    
+    def _mark_logged(self, session: AnalysisSession) -> None:
+        """Record that a session's current contents are on disk."""
+        self._logged_sizes[session.session_id] = (
+            len(session.video_ids), len(session.search_queries), len(session.resources)
+        )
+    
+    @contextmanager
+    def batch(self) -> Iterator["ResourceManager"]:
+        """Defer session persistence until the outermost batch exits.
+        
+        Each changed session is then logged once, however many times it was
+        modified inside the batch::
+        
+            with resource_manager.batch():
+                for query, results in searches:
+                    resource_manager.save_search_results(query, results)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush_pending_changes()
+    
+    def _flush_pending_changes(self) -> None:
+        """Log the changes collected by batch()."""
+        changes = self._pending_changes
+        switched = self._pending_switch
+        self._pending_changes = {}
+        self._pending_switch = False
+        
+        for session_id, op in changes.items():
+            self._write_session_change(op, session_id)
+        if switched and not changes:
+            self._write_session_change("switch")
+    
+    def _log_session_change(self, op: str, session_id: Optional[str] = None) -> None:
+        """Record a session change, deferring it while a batch is open.
+        
+        Args:
+            op: "create" for a new session, "update" for additions to an
+                existing one, "delete" to remove it, or "switch" to record
+                only the current session
+            session_id: Session the change applies to
+        """
+        if self._batch_depth:
+            if op == "switch":
+                self._pending_switch = True
+            elif op == "delete" or session_id not in self._pending_changes:
+                # A pending "create" already covers later updates
+                self._pending_changes[session_id] = op
+            return
+        self._write_session_change(op, session_id)
+    
+    def _write_session_change(self, op: str, session_id: Optional[str] = None) -> None:
+        """Append a session change to the log, compacting when it grows long."""
+        record: Dict[str, Any] = {"op": op, "current_session_id": self.current_session_id}
+        session = self.sessions.get(session_id) if session_id is not None else None
+        if session is None and op in ("create", "update"):
+            return
+        if op == "create":
+            record["session"] = session.to_dict()
+        elif op == "update":
+            record.update(self._session_delta(session))
+        elif op == "delete":
+            record["session_id"] = session_id
+            self._logged_sizes.pop(session_id, None)
+        if session is not None:
+            self._mark_logged(session)
+        
+        try:
+            if self._session_log is None:
+                self._session_log = self._open_session_log()
+            self._session_log.write(_dumps(record) + b"\n")
+            self._session_log.flush()
+        except Exception as e:
+            logger.error(f"Failed to log session change: {e}")
+            # The snapshot then holds the change; truncating the log keeps
+            # older records from being replayed over it
+            self.compact()
+            return
+        
+        self._logged_ops += 1
+        if self._logged_ops >= self.compact_every:
+            self.compact()
+    
+    def _open_session_log(self):
+        """Open the session log for appending, after any complete lines.
+        
+        A log left with a partial last line (compaction failed after a
+        crash) is cut back to its last newline first.
+        """
+        log = open(self._session_log_path, 'ab+')
+        size = log.seek(0, os.SEEK_END)
+        if size:
+            log.seek(-1, os.SEEK_END)
+            if log.read(1) != b"\n":
+                log.seek(0)
+                keep = log.read().rfind(b"\n") + 1
+                log.truncate(keep)
+                logger.warning("Dropped a partial record at the end of the session log")
+        return log
+    
+    def _session_delta(self, session: AnalysisSession) -> Dict[str, Any]:
+        """Build the fields of an "update" record for a session."""
+        logged_videos, logged_queries, logged_resources = self._logged_sizes.get(
+            session.session_id, (0, 0, 0)
+        )
+        delta: Dict[str, Any] = {
+            "session_id": session.session_id,
+            "updated_at": session.updated_at.isoformat(),
+        }
+        video_ids = list(itertools.islice(session.video_ids, logged_videos, None))
+        if video_ids:
+            delta["video_ids"] = video_ids
+        if len(session.search_queries) > logged_queries:
+            delta["search_queries"] = session.search_queries[logged_queries:]
+        if len(session.resources) > logged_resources:
+            delta["resources"] = session.resources[logged_resources:]
+        return delta
+    
+    def compact(self) -> None:
+        """Write a full sessions snapshot and truncate the change log.
+        
+        The log is kept if the snapshot could not be written.
+        """
+        if not self._save_sessions():
+            return
+        
+        if self._session_log is not None:
+            try:
+                self._session_log.close()
+            except OSError as e:
+                logger.error(f"Failed to close session log: {e}")
+            self._session_log = None
+        try:
+            open(self._session_log_path, 'w').close()
+        except Exception as e:
+            logger.error(f"Failed to truncate session log: {e}")
+        self._logged_ops = 0
+    
+    def close(self) -> None:
+        """Compact the session log and release its file handle."""
+        self.compact()
+    
+    def _save_sessions(self) -> bool:
+        """Save a snapshot of all sessions to disk.
+        
+        The snapshot is written to a temporary file, synced and renamed over
+        sessions.json, so a crash leaves either the old or the new snapshot.
+        
+        Returns:
+            True if the snapshot was written
+        """
         sessions_file = self.sessions_path / "sessions.json"
+        tmp_file = self.sessions_path / f"sessions.json.{os.getpid()}.tmp"
         try:
             sessions_data = {
                 "current_session_id": self.current_session_id,
                 "sessions": [session.to_dict() for session in self.sessions.values()]
             }
             
-            with open(sessions_file, 'w') as f:
-                json.dump(sessions_data, f, indent=2)
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(sessions_data))
+                f.flush()
+                _fdatasync(f.fileno())
+            os.replace(tmp_file, sessions_file)
+            return True
                 
         except Exception as e:
             logger.error(f"Failed to save sessions: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+            return False
     
     def create_session(self, title: str, description: str = "", auto_switch: bool = True) -> str:
         """Create a new analysis session.
@@ -163,10 +555,9 @@ class ResourceManager:
             self.current_session_id = session_id
         
         # Create session directory
-        session_dir = self.sessions_path / session_id
-        session_dir.mkdir(exist_ok=True)
+        self._ensure_dir(self.sessions_path / session_id)
         
-        self._save_sessions()
+        self._log_session_change("create", session_id)
         logger.info(f"Created session '{title}' with ID: {session_id}")
         
         return session_id
@@ -199,7 +590,7 @@ class ResourceManager:
         """
         if session_id in self.sessions:
             self.current_session_id = session_id
-            self._save_sessions()
+            self._log_session_change("switch")
             logger.info(f"Switched to session: {session_id}")
             return True
         return False
@@ -220,15 +611,22 @@ class ResourceManager:
         session_dir = self.sessions_path / session_id
         if session_dir.exists():
             shutil.rmtree(session_dir)
+        self._known_dirs.discard(session_dir)
+        self._details_index = {
+            details_id: path for details_id, path in self._details_index.items()
+            if path.parent != session_dir
+        }
         
         # Remove from memory
+        for resource_uri in self.sessions[session_id].resources:
+            self._resource_cache.pop(resource_uri, None)
         del self.sessions[session_id]
         
         # Update current session if needed
         if self.current_session_id == session_id:
             self.current_session_id = next(iter(self.sessions.keys())) if self.sessions else None
         
-        self._save_sessions()
+        self._log_session_change("delete", session_id)
         logger.info(f"Deleted session: {session_id}")
         return True
     
@@ -250,9 +648,8 @@ class ResourceManager:
             session_id = self.create_session(f"Search: {query[:50]}")
             session = self.get_session(session_id)
         
-        # Generate search ID
-        search_hash = hashlib.md5(f"{query}_{datetime.utcnow().isoformat()}".encode()).hexdigest()[:8]
-        search_id = f"search_{search_hash}"
+        now = datetime.utcnow()
+        search_id = self._new_id("search")
         
         # Extract video IDs
         video_ids = []
@@ -266,7 +663,7 @@ class ResourceManager:
         search_data = {
             "query": query,
             "search_id": search_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "session_id": session.session_id,
             "video_count": len(results),
             "video_ids": video_ids,
@@ -274,17 +671,17 @@ class ResourceManager:
         }
         
         search_file = self.searches_path / f"{search_id}.json"
-        with open(search_file, 'w') as f:
-            json.dump(search_data, f, indent=2)
+        self._write_json_streaming(search_file, search_data, "results")
+        self._json_cache.pop(str(search_file), None)
         
         # Update session
-        session.add_search_query(query)
-        session.add_video_ids(video_ids)
+        session.add_search_query(query, now)
+        session.add_video_ids(video_ids, now)
         
         resource_uri = f"youtube://search/{search_id}"
-        session.add_resource(resource_uri)
+        session.add_resource(resource_uri, now)
         
-        self._save_sessions()
+        self._log_session_change("update", session.session_id)
         
         logger.info(f"Saved search results: {search_id} ({len(video_ids)} videos)")
         return resource_uri
@@ -307,13 +704,14 @@ class ResourceManager:
         
         # Generate details ID
         video_ids = [v.get('id', v.get('video_id', '')) for v in video_details]
-        details_hash = hashlib.md5(f"details_{'_'.join(video_ids[:5])}".encode()).hexdigest()[:8]
+        details_hash = hashlib.blake2b(f"details_{'_'.join(video_ids[:5])}".encode(), digest_size=4).hexdigest()
         details_id = f"details_{details_hash}"
         
         # Save details data
+        now = datetime.utcnow()
         details_data = {
             "details_id": details_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "session_id": session.session_id,
             "video_count": len(video_details),
             "video_ids": video_ids,
@@ -321,16 +719,18 @@ class ResourceManager:
         }
         
         details_file = self.sessions_path / session.session_id / f"{details_id}.json"
-        with open(details_file, 'w') as f:
-            json.dump(details_data, f, indent=2)
+        self._write_json_streaming(details_file, details_data, "details")
+        self._details_index[details_id] = details_file
+        self._json_cache.pop(str(details_file), None)
         
         # Update session
-        session.add_video_ids(video_ids)
+        session.add_video_ids(video_ids, now)
         
         resource_uri = f"youtube://details/{details_id}"
-        session.add_resource(resource_uri)
+        self._resource_cache.pop(resource_uri, None)
+        session.add_resource(resource_uri, now)
         
-        self._save_sessions()
+        self._log_session_change("update", session.session_id)
         
         logger.info(f"Saved video details: {details_id} ({len(video_ids)} videos)")
         return resource_uri
@@ -352,39 +752,43 @@ class ResourceManager:
             session_id = self.create_session(f"Visualization: {viz_type}")
             session = self.get_session(session_id)
         
-        # Generate visualization ID
-        viz_hash = hashlib.md5(f"{viz_type}_{datetime.utcnow().isoformat()}".encode()).hexdigest()[:8]
-        viz_id = f"viz_{viz_type}_{viz_hash}"
+        now = datetime.utcnow()
+        viz_id = self._new_id(f"viz_{viz_type}")
         
         # Create visualization directory
-        viz_dir = self.visualizations_path / session.session_id / viz_id
-        viz_dir.mkdir(parents=True, exist_ok=True)
+        session_viz_dir = self.visualizations_path / session.session_id
+        self._ensure_dir(session_viz_dir)
+        viz_dir = session_viz_dir / viz_id
+        viz_dir.mkdir(exist_ok=True)
+        self._viz_index[viz_id] = viz_dir
         
-        # Save visualization metadata
         viz_metadata = {
             "viz_id": viz_id,
             "viz_type": viz_type,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "session_id": session.session_id,
             "data": viz_data
         }
         
-        metadata_file = viz_dir / "metadata.json"
-        with open(metadata_file, 'w') as f:
-            json.dump(viz_metadata, f, indent=2)
-        
         # Copy visualization files if they exist
         if 'filepath' in viz_data and Path(viz_data['filepath']).exists():
             source_file = Path(viz_data['filepath'])
             dest_file = viz_dir / source_file.name
-            shutil.copy2(source_file, dest_file)
+            self._copy_file(source_file, dest_file)
             viz_metadata['data']['local_filepath'] = str(dest_file)
+            # Lets _read_visualization_contents open the file without a scan
+            viz_metadata['image_file'] = dest_file.name
+        
+        # Save visualization metadata
+        metadata_file = viz_dir / "metadata.json"
+        with open(metadata_file, 'wb') as f:
+            f.write(_dumps(viz_metadata, indent=True))
         
         # Update session
         resource_uri = f"youtube://visualization/{viz_id}"
-        session.add_resource(resource_uri)
+        session.add_resource(resource_uri, now)
         
-        self._save_sessions()
+        self._log_session_change("update", session.session_id)
         
         logger.info(f"Saved visualization: {viz_id} ({viz_type})")
         return resource_uri
@@ -438,8 +842,85 @@ class ResourceManager:
         
         return resources
     
+    @staticmethod
+    def _write_json_streaming(path: Path, data: Dict[str, Any], list_key: str) -> None:
+        """Write data as JSON, encoding the (possibly large) list under list_key
+        one item at a time so the whole document is never held as one string.
+        
+        list_key is written last; the other values are written first, in order.
+        """
+        with open(path, 'wb') as f:
+            f.write(b"{")
+            for key, value in data.items():
+                if key != list_key:
+                    f.write(_dumps(key) + b":" + _dumps(value) + b",")
+            f.write(_dumps(list_key) + b":[")
+            for i, item in enumerate(data[list_key]):
+                if i:
+                    f.write(b",")
+                f.write(_dumps(item))
+            f.write(b"]}")
+    
+    def _copy_file(self, source: Path, dest: Path) -> None:
+        """Copy a file with an in-kernel (reflink capable) copy, falling back
+        to shutil.copy2.
+        
+        The copy is always independent of the source, since the visualization
+        tools rewrite their output files in place. copy_file_range is only
+        given up for good on errors that mean the filesystems can't support
+        it; any other failure falls back for this file alone.
+        """
+        if self._use_copy_file_range:
+            try:
+                self._copy_file_range(source, dest)
+                return
+            except OSError as e:
+                if e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                    logger.debug(f"copy_file_range unavailable: {e}")
+                    self._use_copy_file_range = False
+                else:
+                    logger.debug(f"copy_file_range failed for {source}: {e}")
+        shutil.copy2(source, dest)
+    
+    @staticmethod
+    def _copy_file_range(source: Path, dest: Path) -> None:
+        """Copy with os.copy_file_range, which reflinks on supporting filesystems."""
+        with open(source, 'rb') as src, open(dest, 'wb') as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    raise OSError(f"copy_file_range stopped with {remaining} bytes left")
+                remaining -= copied
+        shutil.copystat(source, dest)
+    
+    def _cache_put(self, cache: OrderedDict, key: str, value: Any) -> None:
+        """Insert into an LRU cache, evicting the least recently used entry."""
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+    
+    def _read_json(self, path: Path) -> Any:
+        """Load a JSON file, reusing the parsed data while its mtime and size are unchanged."""
+        key = str(path)
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._json_cache.get(key)
+        if cached is not None and cached[0] == version:
+            self._json_cache.move_to_end(key)
+            return cached[1]
+        
+        with open(path, 'rb') as f:
+            data = _loads(f.read())
+        self._cache_put(self._json_cache, key, (version, data))
+        return data
+    
     def _load_resource_by_uri(self, resource_uri: str) -> Optional[Resource]:
-        """Load a resource by its URI.
+        """Load a resource by its URI, using the resource cache.
+        
+        Session resources describe live counts, so only file-backed resources
+        are cached.
         
         Args:
             resource_uri: Resource URI (youtube://type/id)
@@ -447,25 +928,24 @@ class ResourceManager:
         Returns:
             MCP Resource object or None
         """
-        if not resource_uri.startswith("youtube://"):
-            return None
-        
-        parts = resource_uri[10:].split('/')
-        if len(parts) != 2:
+        resource = self._resource_cache.get(resource_uri)
+        if resource is not None:
+            self._resource_cache.move_to_end(resource_uri)
+            return resource
+        
+        resource = self._load_resource_uncached(resource_uri)
+        if resource is not None and not resource_uri.startswith("youtube://session/"):
+            self._cache_put(self._resource_cache, resource_uri, resource)
+        return resource
+    
+    def _load_resource_uncached(self, resource_uri: str) -> Optional[Resource]:
+        """Load a resource by its URI from disk."""
+        match = _URI_RE.fullmatch(resource_uri)
+        if not match:
             return None
         
-        resource_type, resource_id = parts
-        
-        if resource_type == "search":
-            return self._load_search_resource(resource_id)
-        elif resource_type == "details":
-            return self._load_details_resource(resource_id)
-        elif resource_type == "visualization":
-            return self._load_visualization_resource(resource_id)
-        elif resource_type == "session":
-            return self._load_session_resource(resource_id)
-        
-        return None
+        resource_type, resource_id = match.groups()
+        return self._resource_loaders[resource_type](resource_id)
     
     def _load_search_resource(self, search_id: str) -> Optional[Resource]:
         """Load a search resource."""
@@ -473,8 +953,7 @@ class ResourceManager:
         if not search_file.exists():
             return None
         
-        with open(search_file, 'r') as f:
-            search_data = json.load(f)
+        search_data = self._read_json(search_file)
         
         return Resource(
             uri=f"youtube://search/{search_id}",
@@ -483,45 +962,72 @@ class ResourceManager:
             mimeType="application/json"
         )
     
+    def _find_details_file(self, details_id: str) -> Optional[Path]:
+        """Locate a details file, scanning session directories on an index miss."""
+        details_file = self._details_index.get(details_id)
+        if details_file is not None and details_file.exists():
+            return details_file
+        
+        file_name = f"{details_id}.json"
+        with os.scandir(self.sessions_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    details_file = Path(entry.path, file_name)
+                    if details_file.exists():
+                        self._details_index[details_id] = details_file
+                        return details_file
+        
+        self._details_index.pop(details_id, None)
+        return None
+    
+    def _find_visualization_dir(self, viz_id: str) -> Optional[Path]:
+        """Locate a visualization directory, scanning on an index miss."""
+        viz_dir = self._viz_index.get(viz_id)
+        if viz_dir is not None and viz_dir.exists():
+            return viz_dir
+        
+        with os.scandir(self.visualizations_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    viz_dir = Path(entry.path, viz_id)
+                    if viz_dir.exists():
+                        self._viz_index[viz_id] = viz_dir
+                        return viz_dir
+        
+        self._viz_index.pop(viz_id, None)
+        return None
+    
     def _load_details_resource(self, details_id: str) -> Optional[Resource]:
         """Load a video details resource."""
-        # Search for the details file in session directories
-        for session_dir in self.sessions_path.iterdir():
-            if session_dir.is_dir():
-                details_file = session_dir / f"{details_id}.json"
-                if details_file.exists():
-                    with open(details_file, 'r') as f:
-                        details_data = json.load(f)
-                    
-                    return Resource(
-                        uri=f"youtube://details/{details_id}",
-                        name=f"Video Details ({details_data['video_count']} videos)",
-                        description=f"Detailed information for {details_data['video_count']} videos",
-                        mimeType="application/json"
-                    )
+        details_file = self._find_details_file(details_id)
+        if details_file is None:
+            return None
         
-        return None
+        details_data = self._read_json(details_file)
+        return Resource(
+            uri=f"youtube://details/{details_id}",
+            name=f"Video Details ({details_data['video_count']} videos)",
+            description=f"Detailed information for {details_data['video_count']} videos",
+            mimeType="application/json"
+        )
     
     def _load_visualization_resource(self, viz_id: str) -> Optional[Resource]:
         """Load a visualization resource."""
-        # Search for the visualization in session directories
-        for session_dir in self.visualizations_path.iterdir():
-            if session_dir.is_dir():
-                viz_dir = session_dir / viz_id
-                if viz_dir.exists():
-                    metadata_file = viz_dir / "metadata.json"
-                    if metadata_file.exists():
-                        with open(metadata_file, 'r') as f:
-                            viz_metadata = json.load(f)
-                        
-                        return Resource(
-                            uri=f"youtube://visualization/{viz_id}",
-                            name=f"Visualization: {viz_metadata['viz_type']}",
-                            description=f"{viz_metadata['viz_type']} visualization",
-                            mimeType="image/png"
-                        )
+        viz_dir = self._find_visualization_dir(viz_id)
+        if viz_dir is None:
+            return None
         
-        return None
+        metadata_file = viz_dir / "metadata.json"
+        if not metadata_file.exists():
+            return None
+        
+        viz_metadata = self._read_json(metadata_file)
+        return Resource(
+            uri=f"youtube://visualization/{viz_id}",
+            name=f"Visualization: {viz_metadata['viz_type']}",
+            description=f"{viz_metadata['viz_type']} visualization",
+            mimeType="image/png"
+        )
     
     def _load_session_resource(self, session_id: str) -> Optional[Resource]:
         """Load a session overview resource."""
@@ -545,24 +1051,14 @@ class ResourceManager:
         Returns:
             Resource contents or None if not found
         """
-        if not uri.startswith("youtube://"):
+        match = _URI_RE.fullmatch(uri)
+        if not match:
             return None
         
-        parts = uri[10:].split('/')
-        if len(parts) != 2:
-            return None
-        
-        resource_type, resource_id = parts
+        resource_type, resource_id = match.groups()
         
         try:
-            if resource_type == "search":
-                return await self._read_search_contents(resource_id)
-            elif resource_type == "details":
-                return await self._read_details_contents(resource_id)
-            elif resource_type == "visualization":
-                return await self._read_visualization_contents(resource_id)
-            elif resource_type == "session":
-                return await self._read_session_contents(resource_id)
+            return await self._resource_readers[resource_type](resource_id)
         except Exception as e:
             logger.error(f"Failed to read resource {uri}: {e}")
         
@@ -574,50 +1070,67 @@ class ResourceManager:
         if not search_file.exists():
             return None
         
-        with open(search_file, 'r') as f:
-            search_data = json.load(f)
+        search_data = self._read_json(search_file)
         
         return TextResourceContents(
             uri=f"youtube://search/{search_id}",
             mimeType="application/json",
-            text=json.dumps(search_data, indent=2)
+            text=_dumps(search_data, indent=True).decode('utf-8')
         )
     
     async def _read_details_contents(self, details_id: str) -> Optional[TextResourceContents]:
         """Read video details resource contents."""
-        for session_dir in self.sessions_path.iterdir():
-            if session_dir.is_dir():
-                details_file = session_dir / f"{details_id}.json"
-                if details_file.exists():
-                    with open(details_file, 'r') as f:
-                        details_data = json.load(f)
-                    
-                    return TextResourceContents(
-                        uri=f"youtube://details/{details_id}",
-                        mimeType="application/json",
-                        text=json.dumps(details_data, indent=2)
-                    )
+        details_file = self._find_details_file(details_id)
+        if details_file is None:
+            return None
         
-        return None
+        details_data = self._read_json(details_file)
+        return TextResourceContents(
+            uri=f"youtube://details/{details_id}",
+            mimeType="application/json",
+            text=_dumps(details_data, indent=True).decode('utf-8')
+        )
     
     async def _read_visualization_contents(self, viz_id: str) -> Optional[BlobResourceContents]:
         """Read visualization resource contents."""
-        for session_dir in self.visualizations_path.iterdir():
-            if session_dir.is_dir():
-                viz_dir = session_dir / viz_id
-                if viz_dir.exists():
-                    # Look for image files
-                    for img_file in viz_dir.glob("*.png"):
-                        with open(img_file, 'rb') as f:
-                            blob_data = f.read()
-                        
-                        return BlobResourceContents(
-                            uri=f"youtube://visualization/{viz_id}",
-                            mimeType="image/png",
-                            blob=blob_data
-                        )
+        viz_dir = self._find_visualization_dir(viz_id)
+        if viz_dir is None:
+            return None
         
-        return None
+        image_path = None
+        metadata_file = viz_dir / "metadata.json"
+        if metadata_file.exists():
+            image_file = self._read_json(metadata_file).get("image_file")
+            if image_file and image_file.endswith(".png"):
+                image_path = os.path.join(viz_dir, image_file)
+        
+        if image_path is None or not os.path.isfile(image_path):
+            # Older visualizations don't record the file; look for one
+            image_path = None
+            with os.scandir(viz_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".png") and entry.is_file():
+                        image_path = entry.path
+                        break
+        
+        if image_path is None:
+            return None
+        
+        return BlobResourceContents(
+            uri=f"youtube://visualization/{viz_id}",
+            mimeType="image/png",
+            blob=self._read_base64(image_path)
+        )
+    
+    @staticmethod
+    def _read_base64(path: str) -> str:
+        """Base64-encode a file, encoding straight from a memory map rather
+        than first copying the file into a bytes object."""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return base64.b64encode(mapped).decode('ascii')
     
     async def _read_session_contents(self, session_id: str) -> Optional[TextResourceContents]:
         """Read session resource contents."""
@@ -628,7 +1141,7 @@ class ResourceManager:
         return TextResourceContents(
             uri=f"youtube://session/{session_id}",
             mimeType="application/json",
-            text=json.dumps(session.to_dict(), indent=2)
+            text=_dumps(session.to_dict(), indent=True).decode('utf-8')
         )
     
     def list_all_resources(self) -> List[Resource]:
@@ -660,15 +1173,22 @@ class ResourceManager:
             if session.updated_at < cutoff_date:
                 sessions_to_delete.append(session.session_id)
         
-        for session_id in sessions_to_delete:
-            if self.delete_session(session_id):
-                cleaned_count += 1
+        with self.batch():
+            for session_id in sessions_to_delete:
+                if self.delete_session(session_id):
+                    cleaned_count += 1
         
         # Clean up orphaned search files
-        for search_file in self.searches_path.glob("*.json"):
-            if datetime.fromtimestamp(search_file.stat().st_mtime) < cutoff_date:
-                search_file.unlink()
-                cleaned_count += 1
+        cutoff_ts = time.time() - max_age_days * 86400
+        with os.scandir(self.searches_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                if entry.stat().st_mtime < cutoff_ts:
+                    os.unlink(entry.path)
+                    self._resource_cache.pop(f"youtube://search/{entry.name[:-5]}", None)
+                    self._json_cache.pop(entry.path, None)
+                    cleaned_count += 1
         
         logger.info(f"Cleaned up {cleaned_count} old resources")
         return cleaned_count
\ No newline at end of file
@@ -68,6 +68,40 @@ logger = logging.getLogger(__name__)
 class YouTubeMCPTools:
     """Core YouTube MCP Tools implementation."""
     
+    # Tools handled by execute_tool; each is implemented by the method "_<name>"
+    _TOOL_NAMES = (
+        "search_youtube_videos",
+        "get_video_details",
+        "get_channel_info",
+        "get_channel_videos",
+        "get_video_comments",
+        "get_video_transcript",
+        "analyze_video_performance",
+        "get_trending_videos",
+        "download_video",
+        "get_download_formats",
+        "cleanup_downloads",
+        "create_engagement_chart",
+        "create_word_cloud",
+        "create_performance_radar",
+        "create_views_timeline",
+        "create_comparison_heatmap",
+        "create_analysis_session",
+        "list_analysis_sessions",
+        "switch_analysis_session",
+        "get_session_video_ids",
+        "analyze_session_videos",
+        "extract_video_frames",
+        "cleanup_extracted_frames",
+        "analyze_video_content_from_frames",
+        "generate_dashboard_artifact_prompt",
+        "analyze_video_frames_with_ai",
+        "smart_trim_video",
+        "detect_video_scenes",
+        "analyze_audio_patterns",
+        "extract_content_segments",
+    )
+    
     def __init__(self, config: YouTubeMCPConfig):
         """Initialize YouTube MCP Tools.
         
@@ -121,6 +155,11 @@ class YouTubeMCPTools:
         else:
             self.advanced_trimming = AdvancedTrimmingOrchestrator()
         
+        # Bound handler per tool name, so execute_tool is one dict lookup
+        self._tool_handlers = {
+            name: getattr(self, f"_{name}") for name in self._TOOL_NAMES
+        }
+        
     async def initialize(self) -> None:
         """Initialize all components."""
         try:
@@ -142,7 +181,18 @@ class YouTubeMCPTools:
             logger.error(f"Error cleaning up API client: {e}")
         
         try:
-            # Cache manager cleanup is handled automatically
+            await self.cache_manager.aclose()
+        except Exception as e:
+            cleanup_errors.append(f"Cache manager cleanup: {e}")
+            logger.error(f"Error cleaning up cache manager: {e}")
+        
+        try:
+            self.resource_manager.close()
+        except Exception as e:
+            cleanup_errors.append(f"Resource manager cleanup: {e}")
+            logger.error(f"Error cleaning up resource manager: {e}")
+        
+        try:
             if hasattr(self, 'advanced_trimming'):
                 self.advanced_trimming.cleanup()
         except Exception as e:
@@ -1049,68 +1099,10 @@ class YouTubeMCPTools:
             YouTubeAPIError: If YouTube API call fails
         """
         try:
-            if name == "search_youtube_videos":
-                return await self._search_youtube_videos(**arguments)
-            elif name == "get_video_details":
-                return await self._get_video_details(**arguments)
-            elif name == "get_channel_info":
-                return await self._get_channel_info(**arguments)
-            elif name == "get_channel_videos":
-                return await self._get_channel_videos(**arguments)
-            elif name == "get_video_comments":
-                return await self._get_video_comments(**arguments)
-            elif name == "get_video_transcript":
-                return await self._get_video_transcript(**arguments)
-            elif name == "analyze_video_performance":
-                return await self._analyze_video_performance(**arguments)
-            elif name == "get_trending_videos":
-                return await self._get_trending_videos(**arguments)
-            elif name == "download_video":
-                return await self._download_video(**arguments)
-            elif name == "get_download_formats":
-                return await self._get_download_formats(**arguments)
-            elif name == "cleanup_downloads":
-                return await self._cleanup_downloads(**arguments)
-            elif name == "create_engagement_chart":
-                return await self._create_engagement_chart(**arguments)
-            elif name == "create_word_cloud":
-                return await self._create_word_cloud(**arguments)
-            elif name == "create_performance_radar":
-                return await self._create_performance_radar(**arguments)
-            elif name == "create_views_timeline":
-                return await self._create_views_timeline(**arguments)
-            elif name == "create_comparison_heatmap":
-                return await self._create_comparison_heatmap(**arguments)
-            elif name == "create_analysis_session":
-                return await self._create_analysis_session(**arguments)
-            elif name == "list_analysis_sessions":
-                return await self._list_analysis_sessions(**arguments)
-            elif name == "switch_analysis_session":
-                return await self._switch_analysis_session(**arguments)
-            elif name == "get_session_video_ids":
-                return await self._get_session_video_ids(**arguments)
-            elif name == "analyze_session_videos":
-                return await self._analyze_session_videos(**arguments)
-            elif name == "extract_video_frames":
-                return await self._extract_video_frames(**arguments)
-            elif name == "cleanup_extracted_frames":
-                return await self._cleanup_extracted_frames(**arguments)
-            elif name == "analyze_video_content_from_frames":
-                return await self._analyze_video_content_from_frames(**arguments)
-            elif name == "generate_dashboard_artifact_prompt":
-                return await self._generate_dashboard_artifact_prompt(**arguments)
-            elif name == "analyze_video_frames_with_ai":
-                return await self._analyze_video_frames_with_ai(**arguments)
-            elif name == "smart_trim_video":
-                return await self._smart_trim_video(**arguments)
-            elif name == "detect_video_scenes":
-                return await self._detect_video_scenes(**arguments)
-            elif name == "analyze_audio_patterns":
-                return await self._analyze_audio_patterns(**arguments)
-            elif name == "extract_content_segments":
-                return await self._extract_content_segments(**arguments)
-            else:
+            handler = self._tool_handlers.get(name)
+            if handler is None:
                 raise ValidationError(f"Unknown tool: {name}")
+            return await handler(**arguments)
                 
         except Exception as e:
             logger.error(f"Tool execution failed for {name}: {e}")
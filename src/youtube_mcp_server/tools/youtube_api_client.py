@@ -292,35 +292,29 @@ class YouTubeAPIClient:
         
         cache_key = f"videos_{hash(video_ids_str)}_{hash(parts_str)}"
         
-        # Check cache first
-        cached_result = await self.cache.get(cache_key)
-        if cached_result:
-            return cached_result
-        
-        # Make API call
-        response = await self._make_api_call(
-            'videos',
-            part=parts_str,
-            id=video_ids_str
-        )
-        
-        if not response.get('items'):
-            return []
-        
-        results = []
-        for item in response['items']:
-            video_data = {
-                'id': item['id'],
-                'snippet': item.get('snippet', {}),
-                'statistics': item.get('statistics', {}),
-                'contentDetails': item.get('contentDetails', {})
-            }
-            results.append(video_data)
-        
-        # Cache result
-        await self.cache.set(cache_key, results)
+        async def fetch() -> Optional[List[Dict[str, Any]]]:
+            response = await self._make_api_call(
+                'videos',
+                part=parts_str,
+                id=video_ids_str
+            )
+            
+            # Empty responses aren't cached
+            if not response.get('items'):
+                return None
+            
+            return [
+                {
+                    'id': item['id'],
+                    'snippet': item.get('snippet', {}),
+                    'statistics': item.get('statistics', {}),
+                    'contentDetails': item.get('contentDetails', {})
+                }
+                for item in response['items']
+            ]
         
-        return results
+        # Cached, or fetched once even when requested concurrently
+        return await self.cache.get_or_set(cache_key, fetch) or []
     
     def _normalize_username(self, username: str) -> str:
         """Normalize username by removing @ prefix if present."""
@@ -363,35 +357,29 @@ class YouTubeAPIClient:
             cache_key = f"channels_usernames_{hash(','.join(normalized_usernames))}_{hash(parts_str)}"
             api_params = {'forUsername': ','.join(normalized_usernames)}
         
-        # Check cache first
-        cached_result = await self.cache.get(cache_key)
-        if cached_result:
-            return cached_result
-        
-        # Make API call
-        response = await self._make_api_call(
-            'channels',
-            part=parts_str,
-            **api_params
-        )
-        
-        if not response.get('items'):
-            return []
-        
-        results = []
-        for item in response['items']:
-            channel_data = {
-                'id': item['id'],
-                'snippet': item.get('snippet', {}),
-                'statistics': item.get('statistics', {}),
-                'contentDetails': item.get('contentDetails', {})
-            }
-            results.append(channel_data)
-        
-        # Cache result
-        await self.cache.set(cache_key, results)
+        async def fetch() -> Optional[List[Dict[str, Any]]]:
+            response = await self._make_api_call(
+                'channels',
+                part=parts_str,
+                **api_params
+            )
+            
+            # Empty responses aren't cached
+            if not response.get('items'):
+                return None
+            
+            return [
+                {
+                    'id': item['id'],
+                    'snippet': item.get('snippet', {}),
+                    'statistics': item.get('statistics', {}),
+                    'contentDetails': item.get('contentDetails', {})
+                }
+                for item in response['items']
+            ]
         
-        return results
+        # Cached, or fetched once even when requested concurrently
+        return await self.cache.get_or_set(cache_key, fetch) or []
     
     async def get_video_comments(
         self, 
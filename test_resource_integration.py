@@ -114,6 +114,10 @@ async def test_resource_manager_integration():
             exists = dir_path.exists()
             print(f"   - {dir_name}/: {'✅' if exists else '❌'}")
         
+        # Session changes go to sessions.log first; close() compacts them
+        # into sessions.json
+        youtube_tools.resource_manager.close()
+        
         # Check for session files
         sessions_file = base_path / "sessions" / "sessions.json"
         if sessions_file.exists():
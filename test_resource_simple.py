@@ -166,6 +166,10 @@ def test_resource_manager():
             exists = dir_path.exists()
             print(f"   - {dir_name}/: {'✅' if exists else '❌'}")
         
+        # Session changes go to sessions.log first; close() compacts them
+        # into sessions.json
+        resource_manager.close()
+        
         # Check for session files
         sessions_file = base_path / "sessions" / "sessions.json"
         if sessions_file.exists():
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Tests for ResourceManager session persistence.
+Covers the sessions.log change log: replay, partial-line recovery and compaction.
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from youtube_mcp_server.infrastructure.resource_manager import ResourceManager
+
+
+MOCK_RESULTS = [
+    {"id": "dQw4w9WgXcQ", "title": "Rick Astley - Never Gonna Give You Up"},
+    {"id": "jNQXAC9IVRw", "title": "Me at the zoo"},
+]
+
+
+def _read_log(base_path: Path) -> list:
+    """Return the records in sessions.log."""
+    with open(base_path / "sessions" / "sessions.log", 'rb') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_update_records_carry_only_additions():
+    """Each save logs only the video IDs, queries and resources it added."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        resource_manager = ResourceManager(base_path)
+        session_id = resource_manager.create_session("Delta Session")
+        resource_manager.save_search_results("first", MOCK_RESULTS)
+        resource_manager.save_search_results("second", [{"id": "9bZkp7q19f0"}, MOCK_RESULTS[0]])
+
+        records = _read_log(base_path)
+        assert [record["op"] for record in records] == ["create", "update", "update"]
+        assert records[0]["session"]["session_id"] == session_id
+        assert records[1]["video_ids"] == ["dQw4w9WgXcQ", "jNQXAC9IVRw"]
+        assert records[2]["video_ids"] == ["9bZkp7q19f0"]
+        assert records[2]["search_queries"] == ["second"]
+        assert len(records[2]["resources"]) == 1
+        resource_manager.close()
+
+
+def test_replay_restores_sessions_without_close():
+    """A manager that never compacted is rebuilt from snapshot plus log."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        resource_manager = ResourceManager(base_path)
+        first_id = resource_manager.create_session("First")
+        resource_manager.save_search_results("query", MOCK_RESULTS)
+        second_id = resource_manager.create_session("Second", auto_switch=False)
+        removed_id = resource_manager.create_session("Removed", auto_switch=False)
+        resource_manager.delete_session(removed_id)
+        resource_manager.switch_session(second_id)
+        expected = resource_manager.get_session(first_id).to_dict()
+
+        # No close(): simulates a process that exited before compacting
+        reloaded = ResourceManager(base_path)
+        assert set(reloaded.sessions) == {first_id, second_id}
+        assert reloaded.current_session_id == second_id
+        assert reloaded.get_session(first_id).to_dict() == expected
+        reloaded.close()
+
+
+def test_partial_last_line_is_skipped():
+    """A truncated trailing record is ignored and earlier records still apply."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        resource_manager = ResourceManager(base_path)
+        session_id = resource_manager.create_session("Crash Session")
+        resource_manager.save_search_results("query", MOCK_RESULTS)
+
+        with open(base_path / "sessions" / "sessions.log", 'ab') as f:
+            f.write(b'{"op": "update", "session_id": "' + session_id.encode())
+
+        reloaded = ResourceManager(base_path)
+        assert reloaded.get_session_video_ids(session_id) == ["dQw4w9WgXcQ", "jNQXAC9IVRw"]
+        reloaded.close()
+
+
+def test_torn_line_alone_is_compacted_away():
+    """A log holding only a torn line is truncated, so later records survive."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        resource_manager = ResourceManager(base_path)
+        resource_manager.create_session("x")
+        resource_manager.close()
+
+        with open(base_path / "sessions" / "sessions.log", 'ab') as f:
+            f.write(b'{"op":"upd')
+
+        # No close() after the second session: simulates a crash
+        reopened = ResourceManager(base_path)
+        second_id = reopened.create_session("y")
+
+        reloaded = ResourceManager(base_path)
+        assert reloaded.get_session(second_id).title == "y"
+        reloaded.close()
+
+
+def test_append_after_torn_line_starts_a_new_line():
+    """If compaction can't run, the torn bytes are cut before appending."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        resource_manager = ResourceManager(base_path)
+        first_id = resource_manager.create_session("x")
+
+        with open(base_path / "sessions" / "sessions.log", 'ab') as f:
+            f.write(b'{"op":"upd')
+
+        class FailingSnapshotManager(ResourceManager):
+            def _save_sessions(self) -> bool:
+                return False
+
+        reopened = FailingSnapshotManager(base_path)
+        second_id = reopened.create_session("y")
+
+        records = _read_log(base_path)
+        assert [record["op"] for record in records] == ["create", "create"]
+        reloaded = ResourceManager(base_path)
+        assert set(reloaded.sessions) == {first_id, second_id}
+        reloaded.close()
+
+
+def test_malformed_record_does_not_drop_later_ones():
+    """A parseable record missing a key is skipped on its own."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        resource_manager = ResourceManager(base_path)
+        first_id = resource_manager.create_session("x")
+        with open(base_path / "sessions" / "sessions.log", 'ab') as f:
+            f.write(b'{"op": "update"}\n')
+        second_id = resource_manager.create_session("y")
+
+        reloaded = ResourceManager(base_path)
+        assert set(reloaded.sessions) == {first_id, second_id}
+        reloaded.close()
+
+
+def test_failed_log_write_compacts():
+    """A change whose log write fails is kept by a snapshot, not lost on replay."""
+    class BrokenLog:
+        def write(self, data):
+            raise OSError("disk full")
+
+        def close(self):
+            pass
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        resource_manager = ResourceManager(base_path)
+        session_id = resource_manager.create_session("x")
+        resource_manager._session_log = BrokenLog()
+        resource_manager.save_search_results("query", MOCK_RESULTS)
+        assert (base_path / "sessions" / "sessions.log").stat().st_size == 0
+
+        reloaded = ResourceManager(base_path)
+        assert reloaded.get_session_video_ids(session_id) == ["dQw4w9WgXcQ", "jNQXAC9IVRw"]
+        reloaded.close()
+
+
+def test_compaction_writes_snapshot_and_truncates_log():
+    """compact() runs every compact_every changes and on close()."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        sessions_file = base_path / "sessions" / "sessions.json"
+        log_file = base_path / "sessions" / "sessions.log"
+
+        resource_manager = ResourceManager(base_path, compact_every=3)
+        session_id = resource_manager.create_session("Compact Session")
+        resource_manager.save_search_results("one", MOCK_RESULTS[:1])
+        assert len(_read_log(base_path)) == 2
+
+        # Third logged change triggers compaction
+        resource_manager.save_search_results("two", MOCK_RESULTS[1:])
+        assert log_file.stat().st_size == 0
+        with open(sessions_file, 'r') as f:
+            snapshot = json.load(f)
+        assert snapshot["current_session_id"] == session_id
+        assert snapshot["sessions"][0]["video_ids"] == ["dQw4w9WgXcQ", "jNQXAC9IVRw"]
+
+        # Later changes are deltas against the snapshot
+        resource_manager.save_search_results("three", [{"id": "9bZkp7q19f0"}])
+        assert _read_log(base_path)[0]["video_ids"] == ["9bZkp7q19f0"]
+        resource_manager.close()
+        assert log_file.stat().st_size == 0
+
+        reloaded = ResourceManager(base_path)
+        assert reloaded.get_session(session_id).search_queries == ["one", "two", "three"]
+        reloaded.close()
+
+
+def test_batch_logs_each_session_once():
+    """Changes inside batch() are logged once per session when it exits."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        resource_manager = ResourceManager(base_path)
+        with resource_manager.batch():
+            session_id = resource_manager.create_session("Batch Session")
+            resource_manager.save_search_results("one", MOCK_RESULTS[:1])
+            resource_manager.save_search_results("two", MOCK_RESULTS[1:])
+
+        records = _read_log(base_path)
+        assert [record["op"] for record in records] == ["create"]
+        assert records[0]["session"]["search_queries"] == ["one", "two"]
+
+        reloaded = ResourceManager(base_path)
+        assert reloaded.get_session_video_ids(session_id) == ["dQw4w9WgXcQ", "jNQXAC9IVRw"]
+        reloaded.close()
+
+
+if __name__ == "__main__":
+    test_update_records_carry_only_additions()
+    test_replay_restores_sessions_without_close()
+    test_partial_last_line_is_skipped()
+    test_torn_line_alone_is_compacted_away()
+    test_append_after_torn_line_starts_a_new_line()
+    test_malformed_record_does_not_drop_later_ones()
+    test_failed_log_write_compacts()
+    test_compaction_writes_snapshot_and_truncates_log()
+    test_batch_logs_each_session_once()
+    print("🎉 Session log tests passed!")